@@ -220,11 +220,13 @@ class LayerMixin:
                 )
 
             # Build layer information
+            import win32com.client
+
+            color_map_reverse = {v: k for k, v in COLOR_MAP.items()}
+
             for layer in document.Layers:
                 try:
                     # Get layer properties using dynamic dispatch for robustness
-                    import win32com.client
-
                     dyn_layer = win32com.client.dynamic.Dispatch(layer)
 
                     layer_color_val = 7  # Default white
@@ -239,7 +241,6 @@ class LayerMixin:
                         layer_color_val = 7
 
                     # Convert to name if possible, or keep as string numeric
-                    color_map_reverse = {v: k for k, v in COLOR_MAP.items()}
                     color_name = color_map_reverse.get(
                         layer_color_val, str(layer_color_val)
                     )
@@ -483,20 +484,10 @@ class LayerMixin:
             for handle in handles:
                 try:
                     # Get entity by handle using HandleToObject (O(1) vs O(n) iteration)
-                    try:
-                        entity = document.HandleToObject(handle)
-                    except Exception as e:
-                        results.append(
-                            {
-                                "handle": handle,
-                                "success": False,
-                                "error": f"Entity not found: {e}",
-                            }
-                        )
-                        failed_count += 1
-                        continue
-
-                    # Set color to ByLayer using TrueColor
+                    # then set its color to ByLayer via TrueColor. One exception
+                    # handler per entity is enough: a COM call that fails cannot
+                    # be replayed, so lookup and assignment fail identically.
+                    entity = document.HandleToObject(handle)
                     entity.TrueColor = color_obj
 
                     results.append({"handle": handle, "success": True})
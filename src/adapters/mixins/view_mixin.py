@@ -7,8 +7,8 @@ Handles view operations (zoom, refresh, undo, redo).
 import logging
 import base64
 import os
+import string
 import time
-import re
 import win32gui
 import win32con
 from typing import TYPE_CHECKING, Dict
@@ -16,6 +16,14 @@ from PIL import ImageGrab
 
 logger = logging.getLogger(__name__)
 
+# Characters allowed through SendCommand sanitization: letters, digits,
+# whitespace, and the punctuation common in file paths and CAD commands.
+# A frozenset check beats the regex engine for these short command strings
+# and keeps the whitelist readable.
+_SAFE_COMMAND_CHARS = frozenset(
+    string.ascii_letters + string.digits + string.whitespace + "\\/._-:()"
+)
+
 
 class ViewMixin:
     """Mixin for view operations."""
@@ -47,11 +55,10 @@ class ViewMixin:
         Returns:
             str: The sanitized input safe for SendCommand
         """
-        safe_pattern = re.compile(r"^[a-zA-Z0-9\s\\/._\-:()]+$")
-        if not safe_pattern.match(user_input):
+        if not _SAFE_COMMAND_CHARS.issuperset(user_input):
             logger.warning(f"Input sanitized due to unsafe characters: {user_input}")
-            # Remove all characters that don't match safe pattern
-            sanitized = re.sub(r"[^a-zA-Z0-9\s\\/._\-:()]", "", user_input)
+            # Keep only whitelisted characters
+            sanitized = "".join([c for c in user_input if c in _SAFE_COMMAND_CHARS])
             logger.debug(f"Sanitized to: {sanitized}")
             return sanitized
         return user_input
@@ -39,7 +39,12 @@ class LineWeight(Enum):
     @staticmethod
     def is_valid(weight: int) -> bool:
         """Check if weight is valid."""
-        return weight in [w.value for w in LineWeight]
+        return weight in _VALID_LINEWEIGHTS
+
+
+# Built once after the enum body; is_valid previously rebuilt this list
+# on every call.
+_VALID_LINEWEIGHTS = frozenset(w.value for w in LineWeight)
 
 
 class Color(Enum):
@@ -10,8 +10,11 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from .exceptions import ConfigError
 
+# Config objects are read-only after parsing, so slots (no per-instance
+# __dict__) and frozen (hashable, safe to share across threads) both fit.
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CADConfig:
     """Configuration for a specific CAD application."""
 
@@ -20,7 +23,7 @@ class CADConfig:
     startup_wait_time: float  # Seconds to wait for CAD to start
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OutputConfig:
     """Configuration for output files."""
 
@@ -28,7 +31,7 @@ class OutputConfig:
     format: str  # File format (dwg, dxf, etc.)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DashboardConfig:
     """Configuration for the web dashboard."""
 
@@ -36,7 +39,7 @@ class DashboardConfig:
     host: str = "127.0.0.1"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServerConfig:
     """Complete server configuration."""
 
@@ -15,13 +15,29 @@ Note: Adapter management has been moved to adapters.adapter_manager
 from .constants import COLOR_MAP
 from .helpers import parse_coordinate, parse_handles, result_message
 from .decorators import cad_tool, get_current_adapter, set_current_adapter
-from adapters.adapter_manager import (
-    get_adapter,
-    get_active_cad_type,
-    set_active_cad_type,
-    auto_detect_cad,
+
+# Adapter-manager re-exports are resolved lazily (PEP 562) so that importing
+# mcp_tools does not drag in the whole COM adapter stack. Pure-Python
+# consumers (shorthand parsing, validation) pay nothing until an adapter
+# function is actually requested.
+_ADAPTER_MANAGER_EXPORTS = frozenset(
+    {
+        "get_adapter",
+        "get_active_cad_type",
+        "set_active_cad_type",
+        "auto_detect_cad",
+    }
 )
 
+
+def __getattr__(name):
+    if name in _ADAPTER_MANAGER_EXPORTS:
+        from adapters import adapter_manager
+
+        return getattr(adapter_manager, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "COLOR_MAP",
     "parse_coordinate",
@@ -26,6 +26,15 @@ COLOR_MAP = {
 AC_BY_BLOCK = 0  # Color ByBlock
 AC_BY_LAYER = 256  # Color ByLayer (for entities only)
 
+# ========== Default Entity Properties ==========
+# Single source for the spec defaults advertised in tool docstrings
+# ("DEFAULTS: color=white, layer=0, ...").
+
+DEFAULT_COLOR = "white"
+DEFAULT_LAYER = "0"
+DEFAULT_LINEWEIGHT = 25
+DEFAULT_TEXT_HEIGHT = 2.5
+
 # ========== Selection Set Names ==========
 
 SS_COLOR_SELECT = "_color_select_ss"
@@ -6,9 +6,11 @@ Includes:
 - Logging configuration
 - Coordinate parsing
 - Handle parsing
+- JSON input normalization
 - Message formatting
 """
 
+import json
 import logging
 import sys
 import os
@@ -53,8 +55,11 @@ def setup_logging() -> logging.Logger:
 
 # ========== Parsing Functions ==========
 
-# Precompiled regex for coordinate parsing
-_COORD_PATTERN = re.compile(r"(-?\d+\.?\d*)")
+# Precompiled regex for coordinate parsing. The alternation keeps the
+# number token unambiguous (either digits with an optional fraction, or a
+# bare fraction like ".5"), so the engine never backtracks into a partial
+# match on malformed input.
+_COORD_PATTERN = re.compile(r"([-+]?(?:\d+(?:\.\d*)?|\.\d+))")
 
 
 def parse_coordinate(coord_str: str) -> tuple:
@@ -71,6 +76,15 @@ def parse_coordinate(coord_str: str) -> tuple:
     Raises:
         InvalidParameterError: If coordinate cannot be parsed
     """
+    # Fast path: well-formed "x,y" / "x,y,z" strings convert directly;
+    # the regex scan only runs for inputs with extra text or separators.
+    parts = coord_str.split(",")
+    if 2 <= len(parts) <= 3:
+        try:
+            return tuple(float(p) for p in parts)
+        except ValueError:
+            pass
+
     matches = _COORD_PATTERN.findall(coord_str)
 
     if len(matches) < 2:
@@ -81,6 +95,56 @@ def parse_coordinate(coord_str: str) -> tuple:
     return tuple(float(m) for m in matches[:3])
 
 
+def parse_points(points_str: str, separator: str = "|") -> list:
+    """
+    Parse a separator-delimited string of coordinates in one pass.
+
+    Bulk counterpart to parse_coordinate for polylines, splines, and
+    leader groups. Empty tokens (e.g. from a trailing separator) are
+    skipped.
+
+    Args:
+        points_str: String like "0,0|10,10|20,0"
+        separator: Token separator (default "|")
+
+    Returns:
+        List of coordinate tuples
+
+    Raises:
+        InvalidParameterError: If any token cannot be parsed
+    """
+    return [
+        parse_coordinate(p.strip()) for p in points_str.split(separator) if p.strip()
+    ]
+
+
+def parse_json_list(raw) -> list:
+    """
+    Normalize a tool argument to a list, parsing JSON only when needed.
+
+    FastMCP hands tool arguments over as strings, but several handlers also
+    accept pre-parsed values. This single helper replaces the
+    ``json.loads(x) if isinstance(x, str) else x`` guard that was duplicated
+    across tool modules.
+
+    Args:
+        raw: JSON string, list, or single object
+
+    Returns:
+        List of parsed items (single objects are wrapped)
+
+    Raises:
+        json.JSONDecodeError: If a string argument is not valid JSON
+    """
+    if isinstance(raw, str):
+        raw = json.loads(raw)
+    # json.loads only ever yields plain lists, so the exact type check is
+    # enough (and cheaper than isinstance's subclass walk)
+    if type(raw) is not list:
+        raw = [raw]
+    return raw
+
+
 def parse_handles(handles_str: str) -> list[str]:
     """
     Parse comma-separated handle string to list.
@@ -94,6 +158,34 @@ def parse_handles(handles_str: str) -> list[str]:
     return [h.strip() for h in handles_str.split(",") if h.strip()]
 
 
+# ========== Result Serialization ==========
+
+# Results are compact by default: indentation inflates every response the
+# client has to read back over the wire. Set MCP_DEBUG_JSON=1 to restore
+# pretty-printed output while debugging. Checked once at import.
+_INDENT_RESULTS = os.environ.get("MCP_DEBUG_JSON", "").lower() in ("1", "true", "yes")
+
+# orjson (Rust) encodes result payloads several times faster than the
+# stdlib encoder on large batch results; fall back transparently when it
+# is not installed.
+try:
+    import orjson
+
+    def dumps_result(obj) -> str:
+        """Serialize a tool result to JSON using orjson."""
+        if _INDENT_RESULTS:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def dumps_result(obj) -> str:
+        """Serialize a tool result to JSON using the stdlib encoder."""
+        if _INDENT_RESULTS:
+            return json.dumps(obj, indent=2)
+        return json.dumps(obj, separators=(",", ":"))
+
+
 # ========== Message Formatting ==========
 
 
@@ -14,7 +14,8 @@ Examples:
 """
 
 import json
-from typing import Any, Dict, List, Tuple, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from mcp_tools.validator import autocorrect_spec
 
@@ -134,15 +135,86 @@ def _convert_points_format(points_str: str) -> str:
     return points_str.replace(";", "|")
 
 
-def parse_entity_shorthand(line: str) -> Dict[str, Any]:
+def _convert_leader_groups(value: str) -> str:
+    """Convert double-tilde separated leader groups for adapter.
+
+    Input: "0,0;10,10~~0,0;20,-5"
+    Output: "0,0|10,10~~0,0|20,-5"
     """
-    Parse a single entity shorthand line.
+    groups = []
+    for group_str in value.split("~~"):
+        group_str = group_str.strip()
+        if group_str:
+            groups.append(_convert_points_format(group_str))
+    return "~~".join(groups)
+
+
+def _split_csv(value: str) -> List[str]:
+    """Split a comma-separated field into a list of stripped strings."""
+    return [v.strip() for v in value.split(",")]
+
+
+# Field value converters shared by all shorthand parsers.
+# Looked up by field name instead of walking an if/elif chain per field;
+# fields without an entry pass through as plain strings.
+FIELD_CONVERTERS: Dict[str, Any] = {
+    # Booleans
+    "closed": _parse_bool,
+    "save_changes": _parse_bool,
+    # Point collections
+    "points": _convert_points_format,
+    "leader_groups": _convert_leader_groups,
+    # Comma-separated lists
+    "names": _split_csv,
+    "entity_handles": _split_csv,
+    # Numeric fields
+    "radius": _try_number,
+    "height": _try_number,
+    "start_angle": _try_number,
+    "end_angle": _try_number,
+    "offset": _try_number,
+    "text_height": _try_number,
+    "offset_x": _try_number,
+    "offset_y": _try_number,
+    "angle": _try_number,
+    "scale_factor": _try_number,
+    "center_x": _try_number,
+    "center_y": _try_number,
+    "lineweight": _try_number,
+    "scale": _try_number,
+    "rotation": _try_number,
+}
 
-    Args:
-        line: Shorthand string like "line|0,0|10,10|red|walls"
 
-    Returns:
-        Dictionary with type and fields
+def _build_parse_plan(
+    field_table: Dict[str, FieldList],
+) -> Dict[str, List[Tuple[str, Any, bool, Any]]]:
+    """Pair every field with its converter ahead of time.
+
+    Pre-resolving FIELD_CONVERTERS turns the per-field dict lookup in the
+    parse loops into a tuple unpack; plans are built once at import for
+    each shorthand table.
+    """
+    return {
+        key: [
+            (name, FIELD_CONVERTERS.get(name), required, default)
+            for name, required, default in fields
+        ]
+        for key, fields in field_table.items()
+    }
+
+
+_ENTITY_PARSE_PLAN = _build_parse_plan(ENTITY_FIELDS)
+
+
+@lru_cache(maxsize=256)
+def _parse_entity_shorthand_cached(line: str) -> Dict[str, Any]:
+    """Parse an entity shorthand line (memoized on the raw line).
+
+    Repeated batches often contain identical lines (grids of the same
+    circle, copies of a wall segment); caching skips the re-parse. Entity
+    spec values are all immutable scalars, so callers get a shallow copy
+    from the public wrapper.
     """
     parts = [p.strip() for p in line.split("|")]
     if not parts:
@@ -156,44 +228,16 @@ def parse_entity_shorthand(line: str) -> Dict[str, Any]:
     if canonical_type not in ENTITY_FIELDS:
         return {"type": entity_type, "error": f"Unknown type: {entity_type}"}
 
-    fields = ENTITY_FIELDS[canonical_type]
+    plan = _ENTITY_PARSE_PLAN[canonical_type]
     spec: Dict[str, Any] = {"type": canonical_type}
 
     # Map positional arguments to fields
-    for i, (field_name, required, default) in enumerate(fields):
+    for i, (field_name, converter, required, default) in enumerate(plan):
         value_index = i + 1  # +1 because index 0 is the type
 
         if value_index < len(parts) and parts[value_index]:
             value = parts[value_index]
-
-            # Special handling for specific fields
-            if field_name == "closed":
-                spec[field_name] = _parse_bool(value)
-            elif field_name == "points":
-                # Convert semicolon to pipe for adapter
-                spec[field_name] = _convert_points_format(value)
-            elif field_name == "leader_groups":
-                # Convert double-tilde separated groups, each with semicolon-separated points
-                # Input: "0,0;10,10~~0,0;20,-5"
-                # Output: "0,0|10,10~~0,0|20,-5" (for adapter)
-                groups = []
-                for group_str in value.split("~~"):
-                    group_str = group_str.strip()
-                    if group_str:
-                        converted = _convert_points_format(group_str)
-                        groups.append(converted)
-                spec[field_name] = "~~".join(groups)
-            elif field_name in (
-                "radius",
-                "height",
-                "start_angle",
-                "end_angle",
-                "offset",
-                "text_height",
-            ):
-                spec[field_name] = _try_number(value)
-            else:
-                spec[field_name] = value
+            spec[field_name] = converter(value) if converter else value
         elif default is not None:
             spec[field_name] = default
         elif not required:
@@ -202,6 +246,19 @@ def parse_entity_shorthand(line: str) -> Dict[str, Any]:
     return autocorrect_spec(spec, "entity")
 
 
+def parse_entity_shorthand(line: str) -> Dict[str, Any]:
+    """
+    Parse a single entity shorthand line.
+
+    Args:
+        line: Shorthand string like "line|0,0|10,10|red|walls"
+
+    Returns:
+        Dictionary with type and fields
+    """
+    return dict(_parse_entity_shorthand_cached(line))
+
+
 # ========== Entity Operations Parser ==========
 
 ENTITY_OP_FIELDS: Dict[str, FieldList] = {
@@ -248,6 +305,8 @@ ENTITY_OP_FIELDS: Dict[str, FieldList] = {
     ],
 }
 
+_ENTITY_OP_PARSE_PLAN = _build_parse_plan(ENTITY_OP_FIELDS)
+
 
 def parse_entity_op_shorthand(line: str) -> Dict[str, Any]:
     """
@@ -268,27 +327,15 @@ def parse_entity_op_shorthand(line: str) -> Dict[str, Any]:
     if action not in ENTITY_OP_FIELDS:
         return {"action": action, "error": f"Unknown action: {action}"}
 
-    fields = ENTITY_OP_FIELDS[action]
+    plan = _ENTITY_OP_PARSE_PLAN[action]
     spec: Dict[str, Any] = {"action": action}
 
-    for i, (field_name, required, default) in enumerate(fields):
+    for i, (field_name, converter, required, default) in enumerate(plan):
         value_index = i + 1
 
         if value_index < len(parts) and parts[value_index]:
             value = parts[value_index]
-
-            # Convert numeric fields
-            if field_name in (
-                "offset_x",
-                "offset_y",
-                "angle",
-                "scale_factor",
-                "center_x",
-                "center_y",
-            ):
-                spec[field_name] = _try_number(value)
-            else:
-                spec[field_name] = value
+            spec[field_name] = converter(value) if converter else value
         elif default is not None:
             spec[field_name] = default
 
@@ -333,6 +380,8 @@ LAYER_OP_FIELDS: Dict[str, FieldList] = {
     ],
 }
 
+_LAYER_OP_PARSE_PLAN = _build_parse_plan(LAYER_OP_FIELDS)
+
 # Action aliases for layers
 LAYER_ACTION_ALIASES = {
     "on": "turn_on",
@@ -362,23 +411,15 @@ def parse_layer_op_shorthand(line: str) -> Dict[str, Any]:
     if canonical_action not in LAYER_OP_FIELDS:
         return {"action": action, "error": f"Unknown action: {action}"}
 
-    fields = LAYER_OP_FIELDS[canonical_action]
+    plan = _LAYER_OP_PARSE_PLAN[canonical_action]
     spec: Dict[str, Any] = {"action": canonical_action}
 
-    for i, (field_name, required, default) in enumerate(fields):
+    for i, (field_name, converter, required, default) in enumerate(plan):
         value_index = i + 1
 
         if value_index < len(parts) and parts[value_index]:
             value = parts[value_index]
-
-            # Convert numeric fields
-            if field_name == "lineweight":
-                spec[field_name] = _try_number(value)
-            elif field_name == "names":
-                # Keep as comma-separated string, convert to list
-                spec[field_name] = [n.strip() for n in value.split(",")]
-            else:
-                spec[field_name] = value
+            spec[field_name] = converter(value) if converter else value
         elif default is not None:
             spec[field_name] = default
 
@@ -416,6 +457,8 @@ BLOCK_OP_FIELDS: Dict[str, FieldList] = {
     ],
 }
 
+_BLOCK_OP_PARSE_PLAN = _build_parse_plan(BLOCK_OP_FIELDS)
+
 
 def parse_block_op_shorthand(line: str) -> Dict[str, Any]:
     """
@@ -436,23 +479,15 @@ def parse_block_op_shorthand(line: str) -> Dict[str, Any]:
     if action not in BLOCK_OP_FIELDS:
         return {"action": action, "error": f"Unknown action: {action}"}
 
-    fields = BLOCK_OP_FIELDS[action]
+    plan = _BLOCK_OP_PARSE_PLAN[action]
     spec: Dict[str, Any] = {"action": action}
 
-    for i, (field_name, required, default) in enumerate(fields):
+    for i, (field_name, converter, required, default) in enumerate(plan):
         value_index = i + 1
 
         if value_index < len(parts) and parts[value_index]:
             value = parts[value_index]
-
-            # Convert numeric fields
-            if field_name in ("scale", "rotation"):
-                spec[field_name] = _try_number(value)
-            elif field_name == "entity_handles":
-                # Keep as list
-                spec[field_name] = [h.strip() for h in value.split(",")]
-            else:
-                spec[field_name] = value
+            spec[field_name] = converter(value) if converter else value
         elif default is not None:
             spec[field_name] = default
 
@@ -477,6 +512,8 @@ FILE_OP_FIELDS: Dict[str, FieldList] = {
     ],
 }
 
+_FILE_OP_PARSE_PLAN = _build_parse_plan(FILE_OP_FIELDS)
+
 
 def parse_file_op_shorthand(line: str) -> Dict[str, Any]:
     """
@@ -497,7 +534,7 @@ def parse_file_op_shorthand(line: str) -> Dict[str, Any]:
     if action not in FILE_OP_FIELDS:
         return {"action": action, "error": f"Unknown action: {action}"}
 
-    fields = FILE_OP_FIELDS[action]
+    plan = _FILE_OP_PARSE_PLAN[action]
     spec: Dict[str, Any] = {"action": action}
 
     # Special handling for save - detect if path or filename
@@ -512,16 +549,12 @@ def parse_file_op_shorthand(line: str) -> Dict[str, Any]:
             spec["format"] = parts[2]
         return autocorrect_spec(spec, "file_op")
 
-    for i, (field_name, required, default) in enumerate(fields):
+    for i, (field_name, converter, required, default) in enumerate(plan):
         value_index = i + 1
 
         if value_index < len(parts) and parts[value_index]:
             value = parts[value_index]
-
-            if field_name == "save_changes":
-                spec[field_name] = _parse_bool(value)
-            else:
-                spec[field_name] = value
+            spec[field_name] = converter(value) if converter else value
         elif default is not None:
             spec[field_name] = default
 
@@ -530,6 +563,31 @@ def parse_file_op_shorthand(line: str) -> Dict[str, Any]:
 
 # ========== Main Parser Functions ==========
 
+# Union of all entry keywords recognized when deciding whether a semicolon
+# separates two entries or two coordinates. Built once at import so
+# _split_entries does a single frozenset lookup per candidate word.
+_KNOWN_ENTRY_TYPES = frozenset(ENTITY_FIELDS) | frozenset(ENTITY_OP_FIELDS)
+
+
+def _try_parse_json_specs(
+    input_str: str, context: str
+) -> Optional[List[Dict[str, Any]]]:
+    """Parse JSON-looking input into corrected specs, or return None.
+
+    None signals the caller to fall back to shorthand parsing, so the
+    five parse_*_input functions share one JSON-detection block instead
+    of repeating the try/except at every call site.
+    """
+    if not input_str.startswith(("[", "{")):
+        return None
+    try:
+        data = json.loads(input_str)
+    except json.JSONDecodeError:
+        return None
+    if isinstance(data, dict):
+        return [autocorrect_spec(data, context)]
+    return [autocorrect_spec(item, context) for item in data]
+
 
 def _split_entries(input_str: str) -> List[str]:
     """
@@ -562,7 +620,7 @@ def _split_entries(input_str: str) -> List[str]:
 
             for part in test_parts[1:]:
                 first_word = part.strip().split("|")[0].lower() if "|" in part else ""
-                if first_word in ENTITY_FIELDS or first_word in ENTITY_OP_FIELDS:
+                if first_word in _KNOWN_ENTRY_TYPES:
                     is_multi_entry = True
                     break
 
@@ -588,15 +646,9 @@ def parse_drawing_input(input_str: str) -> List[Dict[str, Any]]:
     """
     input_str = input_str.strip()
 
-    # Detect JSON
-    if input_str.startswith("[") or input_str.startswith("{"):
-        try:
-            data = json.loads(input_str)
-            if isinstance(data, dict):
-                return [autocorrect_spec(data, "entity")]
-            return [autocorrect_spec(item, "entity") for item in data]
-        except json.JSONDecodeError:
-            pass  # Fall through to shorthand parsing
+    specs = _try_parse_json_specs(input_str, "entity")
+    if specs is not None:
+        return specs
 
     # Parse as shorthand
     entries = _split_entries(input_str)
@@ -615,15 +667,9 @@ def parse_entity_ops_input(input_str: str) -> List[Dict[str, Any]]:
     """
     input_str = input_str.strip()
 
-    # Detect JSON
-    if input_str.startswith("[") or input_str.startswith("{"):
-        try:
-            data = json.loads(input_str)
-            if isinstance(data, dict):
-                return [autocorrect_spec(data, "entity_op")]
-            return [autocorrect_spec(item, "entity_op") for item in data]
-        except json.JSONDecodeError:
-            pass
+    specs = _try_parse_json_specs(input_str, "entity_op")
+    if specs is not None:
+        return specs
 
     entries = _split_entries(input_str)
     return [parse_entity_op_shorthand(entry) for entry in entries]
@@ -641,15 +687,9 @@ def parse_layer_ops_input(input_str: str) -> List[Dict[str, Any]]:
     """
     input_str = input_str.strip()
 
-    # Detect JSON
-    if input_str.startswith("[") or input_str.startswith("{"):
-        try:
-            data = json.loads(input_str)
-            if isinstance(data, dict):
-                return [autocorrect_spec(data, "layer_op")]
-            return [autocorrect_spec(item, "layer_op") for item in data]
-        except json.JSONDecodeError:
-            pass
+    specs = _try_parse_json_specs(input_str, "layer_op")
+    if specs is not None:
+        return specs
 
     entries = _split_entries(input_str)
     return [parse_layer_op_shorthand(entry) for entry in entries]
@@ -667,15 +707,9 @@ def parse_block_ops_input(input_str: str) -> List[Dict[str, Any]]:
     """
     input_str = input_str.strip()
 
-    # Detect JSON
-    if input_str.startswith("[") or input_str.startswith("{"):
-        try:
-            data = json.loads(input_str)
-            if isinstance(data, dict):
-                return [autocorrect_spec(data, "block_op")]
-            return [autocorrect_spec(item, "block_op") for item in data]
-        except json.JSONDecodeError:
-            pass
+    specs = _try_parse_json_specs(input_str, "block_op")
+    if specs is not None:
+        return specs
 
     entries = _split_entries(input_str)
     return [parse_block_op_shorthand(entry) for entry in entries]
@@ -693,15 +727,9 @@ def parse_file_ops_input(input_str: str) -> List[Dict[str, Any]]:
     """
     input_str = input_str.strip()
 
-    # Detect JSON
-    if input_str.startswith("[") or input_str.startswith("{"):
-        try:
-            data = json.loads(input_str)
-            if isinstance(data, dict):
-                return [autocorrect_spec(data, "file_op")]
-            return [autocorrect_spec(item, "file_op") for item in data]
-        except json.JSONDecodeError:
-            pass
+    specs = _try_parse_json_specs(input_str, "file_op")
+    if specs is not None:
+        return specs
 
     entries = _split_entries(input_str)
     return [parse_file_op_shorthand(entry) for entry in entries]
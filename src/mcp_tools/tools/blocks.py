@@ -18,8 +18,9 @@ import logging
 from typing import Optional, Dict, Any, Callable, List, Tuple
 
 
+from mcp_tools.constants import DEFAULT_COLOR, DEFAULT_LAYER
 from mcp_tools.decorators import cad_tool, get_current_adapter
-from mcp_tools.helpers import parse_coordinate
+from mcp_tools.helpers import dumps_result, parse_coordinate, parse_json_list
 from mcp_tools.shorthand import parse_block_ops_input
 
 logger = logging.getLogger(__name__)
@@ -45,11 +46,7 @@ def _create(spec: Dict[str, Any]) -> Dict[str, Any]:
 
     entity_handles = spec.get("entity_handles")
     if entity_handles is not None:
-        if isinstance(entity_handles, str):
-            entity_handles = json.loads(entity_handles)
-        if not isinstance(entity_handles, list):
-            entity_handles = [entity_handles]
-        entity_handles = [str(h) for h in entity_handles]
+        entity_handles = [str(h) for h in parse_json_list(entity_handles)]
 
         result = adapter.create_block_from_entities(
             block_name=block_name,
@@ -84,8 +81,8 @@ def _insert(spec: Dict[str, Any]) -> Dict[str, Any]:
     point = parse_coordinate(spec["insertion_point"])
     scale = spec.get("scale", 1.0)
     rotation = spec.get("rotation", 0.0)
-    layer = spec.get("layer", "0")
-    color = spec.get("color", "white")
+    layer = spec.get("layer", DEFAULT_LAYER)
+    color = spec.get("color", DEFAULT_COLOR)
     attributes = spec.get("attributes")
 
     # Parse attributes if passed as JSON string
@@ -301,19 +298,19 @@ def register_block_tools(mcp) -> None:
         try:
             ops_data = parse_block_ops_input(operations)
         except Exception as e:
-            return json.dumps(
+            return dumps_result(
                 {
                     "success": False,
                     "error": f"Invalid input: {str(e)}",
                     "total": 0,
                     "succeeded": 0,
                     "results": [],
-                },
-                indent=2,
+                }
             )
 
         adapter = get_current_adapter()
         results = []
+        succeeded = 0
         has_mutations = False
 
         for i, spec in enumerate(ops_data):
@@ -362,6 +359,8 @@ def register_block_tools(mcp) -> None:
             try:
                 result = handler(spec)
                 results.append({"index": i, "action": action_lower, **result})
+                if result.get("success"):
+                    succeeded += 1
                 if action_lower in ("create", "insert"):
                     has_mutations = True
             except Exception as e:
@@ -376,14 +375,13 @@ def register_block_tools(mcp) -> None:
                 )
 
         # Single refresh only if mutations occurred
-        if has_mutations and any(r.get("success") for r in results):
+        if has_mutations and succeeded:
             adapter.refresh_view()
 
-        return json.dumps(
+        return dumps_result(
             {
                 "total": len(ops_data),
-                "succeeded": sum(1 for r in results if r.get("success")),
+                "succeeded": succeeded,
                 "results": results,
-            },
-            indent=2,
+            }
         )
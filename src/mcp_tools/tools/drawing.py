@@ -32,7 +32,6 @@ SHORTHAND FORMAT (one per line):
                       -> Both converge to Text at 50,50
 """
 
-import json
 import logging
 from typing import Optional, Dict, Any, Callable, List, Tuple
 
@@ -49,8 +48,14 @@ from core.models import (
     DrawSplineRequest,
     DrawMLeaderRequest,
 )
+from mcp_tools.constants import (
+    DEFAULT_COLOR,
+    DEFAULT_LAYER,
+    DEFAULT_LINEWEIGHT,
+    DEFAULT_TEXT_HEIGHT,
+)
 from mcp_tools.decorators import cad_tool, get_current_adapter
-from mcp_tools.helpers import parse_coordinate
+from mcp_tools.helpers import dumps_result, parse_coordinate, parse_points
 from mcp_tools.shorthand import parse_drawing_input
 
 logger = logging.getLogger(__name__)
@@ -74,9 +79,9 @@ def _draw_line(spec: Dict[str, Any]) -> str:
     validated = DrawLineRequest(
         start=parse_coordinate(spec["start"]),
         end=parse_coordinate(spec["end"]),
-        color=spec.get("color", "white"),
-        layer=spec.get("layer", "0"),
-        lineweight=spec.get("lineweight", 25),
+        color=spec.get("color", DEFAULT_COLOR),
+        layer=spec.get("layer", DEFAULT_LAYER),
+        lineweight=spec.get("lineweight", DEFAULT_LINEWEIGHT),
     )
     return get_current_adapter().draw_line(
         validated.start,
@@ -101,9 +106,9 @@ def _draw_circle(spec: Dict[str, Any]) -> str:
     validated = DrawCircleRequest(
         center=parse_coordinate(spec["center"]),
         radius=spec["radius"],
-        color=spec.get("color", "white"),
-        layer=spec.get("layer", "0"),
-        lineweight=spec.get("lineweight", 25),
+        color=spec.get("color", DEFAULT_COLOR),
+        layer=spec.get("layer", DEFAULT_LAYER),
+        lineweight=spec.get("lineweight", DEFAULT_LINEWEIGHT),
     )
     return get_current_adapter().draw_circle(
         validated.center,
@@ -131,9 +136,9 @@ def _draw_arc(spec: Dict[str, Any]) -> str:
         radius=spec["radius"],
         start_angle=spec["start_angle"],
         end_angle=spec["end_angle"],
-        color=spec.get("color", "white"),
-        layer=spec.get("layer", "0"),
-        lineweight=spec.get("lineweight", 25),
+        color=spec.get("color", DEFAULT_COLOR),
+        layer=spec.get("layer", DEFAULT_LAYER),
+        lineweight=spec.get("lineweight", DEFAULT_LINEWEIGHT),
     )
     return get_current_adapter().draw_arc(
         validated.center,
@@ -160,9 +165,9 @@ def _draw_rectangle(spec: Dict[str, Any]) -> str:
     validated = DrawRectangleRequest(
         corner1=parse_coordinate(spec["corner1"]),
         corner2=parse_coordinate(spec["corner2"]),
-        color=spec.get("color", "white"),
-        layer=spec.get("layer", "0"),
-        lineweight=spec.get("lineweight", 25),
+        color=spec.get("color", DEFAULT_COLOR),
+        layer=spec.get("layer", DEFAULT_LAYER),
+        lineweight=spec.get("lineweight", DEFAULT_LINEWEIGHT),
     )
     return get_current_adapter().draw_rectangle(
         validated.corner1,
@@ -185,14 +190,13 @@ def _draw_polyline(spec: Dict[str, Any]) -> str:
     Returns:
         Entity handle string for the created polyline.
     """
-    points_str = spec["points"]
-    point_list = [parse_coordinate(p.strip()) for p in points_str.split("|")]
+    point_list = parse_points(spec["points"])
     validated = DrawPolylineRequest(
         points=point_list,
         closed=spec.get("closed", False),
-        color=spec.get("color", "white"),
-        layer=spec.get("layer", "0"),
-        lineweight=spec.get("lineweight", 25),
+        color=spec.get("color", DEFAULT_COLOR),
+        layer=spec.get("layer", DEFAULT_LAYER),
+        lineweight=spec.get("lineweight", DEFAULT_LINEWEIGHT),
     )
     return get_current_adapter().draw_polyline(
         validated.points,
@@ -218,10 +222,10 @@ def _draw_text(spec: Dict[str, Any]) -> str:
     validated = DrawTextRequest(
         position=parse_coordinate(spec["position"]),
         text=spec["text"],
-        height=spec.get("height", 2.5),
+        height=spec.get("height", DEFAULT_TEXT_HEIGHT),
         rotation=spec.get("rotation", 0.0),
-        color=spec.get("color", "white"),
-        layer=spec.get("layer", "0"),
+        color=spec.get("color", DEFAULT_COLOR),
+        layer=spec.get("layer", DEFAULT_LAYER),
     )
     return get_current_adapter().draw_text(
         validated.position,
@@ -245,15 +249,14 @@ def _draw_spline(spec: Dict[str, Any]) -> str:
     Returns:
         Entity handle string for the created spline.
     """
-    points_str = spec["points"]
-    point_list = [parse_coordinate(p.strip()) for p in points_str.split("|")]
+    point_list = parse_points(spec["points"])
     validated = DrawSplineRequest(
         points=point_list,
         closed=spec.get("closed", False),
         degree=spec.get("degree", 3),
-        color=spec.get("color", "white"),
-        layer=spec.get("layer", "0"),
-        lineweight=spec.get("lineweight", 25),
+        color=spec.get("color", DEFAULT_COLOR),
+        layer=spec.get("layer", DEFAULT_LAYER),
+        lineweight=spec.get("lineweight", DEFAULT_LINEWEIGHT),
     )
     return get_current_adapter().draw_spline(
         validated.points,
@@ -283,8 +286,8 @@ def _add_dimension(spec: Dict[str, Any]) -> str:
         start_pt,
         end_pt,
         spec.get("text"),
-        spec.get("layer", "0"),
-        spec.get("color", "white"),
+        spec.get("layer", DEFAULT_LAYER),
+        spec.get("color", DEFAULT_COLOR),
         spec.get("offset", 10.0),
         _skip_refresh=True,
     )
@@ -314,9 +317,7 @@ def _draw_leader_unified(spec: Dict[str, Any]) -> str:
             for group_str in groups_str.split("~~"):
                 group_str = group_str.strip()
                 if group_str:
-                    group_points = [
-                        parse_coordinate(p.strip()) for p in group_str.split(";")
-                    ]
+                    group_points = parse_points(group_str, ";")
                     if group_points:
                         leader_groups.append(group_points)
 
@@ -338,12 +339,7 @@ def _draw_leader_unified(spec: Dict[str, Any]) -> str:
                 if group_str:
                     # Handle both | and ; separators for robustness
                     # Shorthand might have converted ; to | already
-                    clean_str = group_str.replace(";", "|")
-                    group_points = [
-                        parse_coordinate(p.strip())
-                        for p in clean_str.split("|")
-                        if p.strip()
-                    ]
+                    group_points = parse_points(group_str.replace(";", "|"))
 
                     if len(group_points) < 2:
                         logger.warning(
@@ -355,10 +351,7 @@ def _draw_leader_unified(spec: Dict[str, Any]) -> str:
         else:
             # Simple single-arrow shorthand
             # Treat the whole points string as one group
-            clean_str = points_or_groups.replace(";", "|")
-            group_points = [
-                parse_coordinate(p.strip()) for p in clean_str.split("|") if p.strip()
-            ]
+            group_points = parse_points(points_or_groups.replace(";", "|"))
             if group_points:
                 leader_groups.append(group_points)
 
@@ -386,10 +379,10 @@ def _draw_leader_unified(spec: Dict[str, Any]) -> str:
         leader_groups=leader_groups,
         text=spec.get("text"),
         text_height=spec.get(
-            "text_height", spec.get("height", 2.5)
+            "text_height", spec.get("height", DEFAULT_TEXT_HEIGHT)
         ),  # Support 'height' alias
-        color=spec.get("color", "white"),
-        layer=spec.get("layer", "0"),
+        color=spec.get("color", DEFAULT_COLOR),
+        layer=spec.get("layer", DEFAULT_LAYER),
         arrow_style=spec.get("arrow_style", "_ARROW"),
     )
 
@@ -493,19 +486,19 @@ def register_drawing_tools(mcp):
         try:
             entities_data = parse_drawing_input(entities)
         except Exception as e:
-            return json.dumps(
+            return dumps_result(
                 {
                     "success": False,
                     "error": f"Invalid input: {str(e)}",
                     "total": 0,
                     "created": 0,
                     "results": [],
-                },
-                indent=2,
+                }
             )
 
         adapter = get_current_adapter()
         results = []
+        created = 0
 
         for i, spec in enumerate(entities_data):
             entity_type = spec.get("type")
@@ -562,6 +555,7 @@ def register_drawing_tools(mcp):
                         "success": True,
                     }
                 )
+                created += 1
             except ValidationError as e:
                 error_msg = f"Validation error: {e.errors()[0]['msg']}"
                 logger.error(
@@ -587,14 +581,13 @@ def register_drawing_tools(mcp):
                 )
 
         # Single refresh after all entities drawn
-        if any(r["success"] for r in results):
+        if created:
             adapter.refresh_view()
 
-        return json.dumps(
+        return dumps_result(
             {
                 "total": len(entities_data),
-                "created": sum(1 for r in results if r["success"]),
+                "created": created,
                 "results": results,
-            },
-            indent=2,
+            }
         )
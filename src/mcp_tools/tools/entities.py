@@ -28,7 +28,7 @@ from core.models import (
     ScaleEntityRequest,
 )
 from mcp_tools.decorators import cad_tool, get_current_adapter
-from mcp_tools.helpers import parse_handles
+from mcp_tools.helpers import dumps_result, parse_handles
 from mcp_tools.shorthand import parse_entity_ops_input
 
 logger = logging.getLogger(__name__)
@@ -379,18 +379,18 @@ def register_entity_tools(mcp):
         try:
             ops_data = parse_entity_ops_input(operations)
         except Exception as e:
-            return json.dumps(
+            return dumps_result(
                 {
                     "success": False,
                     "error": f"Invalid input: {str(e)}",
                     "total": 0,
                     "succeeded": 0,
                     "results": [],
-                },
-                indent=2,
+                }
             )
 
         results = []
+        succeeded = 0
 
         for i, spec in enumerate(ops_data):
             action = spec.get("action")
@@ -438,6 +438,8 @@ def register_entity_tools(mcp):
             try:
                 result = handler(spec)
                 results.append({"index": i, "action": action_lower, **result})
+                if result.get("success"):
+                    succeeded += 1
             except ValidationError as e:
                 error_msg = f"Validation error: {e.errors()[0]['msg']}"
                 logger.error(
@@ -462,11 +464,10 @@ def register_entity_tools(mcp):
                     }
                 )
 
-        return json.dumps(
+        return dumps_result(
             {
                 "total": len(ops_data),
-                "succeeded": sum(1 for r in results if r.get("success")),
+                "succeeded": succeeded,
                 "results": results,
-            },
-            indent=2,
+            }
         )
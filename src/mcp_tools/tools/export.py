@@ -10,12 +10,12 @@ Two dimensions:
   format: "json" or "excel"
 """
 
-import json
 import logging
 from pathlib import Path
 
 
 from mcp_tools.decorators import cad_tool, get_current_adapter
+from mcp_tools.helpers import dumps_result
 
 logger = logging.getLogger(__name__)
 
@@ -64,8 +64,8 @@ def _export_excel(adapter, data, filename: str, scope_label: str) -> str:
             f"Security: Attempted export outside output directory. "
             f"Requested: {export_dir}, Allowed: {output_dir}"
         )
-        return json.dumps(
-            {"success": False, "error": "Invalid output directory"}, indent=2
+        return dumps_result(
+            {"success": False, "error": "Invalid output directory"}
         )
 
     export_dir.mkdir(parents=True, exist_ok=True)
@@ -75,8 +75,8 @@ def _export_excel(adapter, data, filename: str, scope_label: str) -> str:
     workbook = Workbook()
     worksheet = workbook.active
     if worksheet is None:
-        return json.dumps(
-            {"success": False, "error": "Failed to create worksheet"}, indent=2
+        return dumps_result(
+            {"success": False, "error": "Failed to create worksheet"}
         )
 
     worksheet.title = f"{scope_label} Data"
@@ -139,14 +139,13 @@ def _export_excel(adapter, data, filename: str, scope_label: str) -> str:
     workbook.save(str(full_filepath))
     logger.info(f"Exported {len(data)} entities to {full_filepath}")
 
-    return json.dumps(
+    return dumps_result(
         {
             "success": True,
             "count": len(data),
             "message": f"Exported {len(data)} entities to {filename}",
             "path": str(full_filepath),
-        },
-        indent=2,
+        }
     )
 
 
@@ -195,20 +194,18 @@ def register_export_tools(mcp):
 
         # Validate parameters
         if scope_lower not in ("all", "selected"):
-            return json.dumps(
+            return dumps_result(
                 {
                     "success": False,
                     "error": f"Unknown scope '{scope}'. Use: all, selected",
-                },
-                indent=2,
+                }
             )
         if format_lower not in ("json", "excel"):
-            return json.dumps(
+            return dumps_result(
                 {
                     "success": False,
                     "error": f"Unknown format '{format}'. Use: json, excel",
-                },
-                indent=2,
+                }
             )
 
         if format_lower == "excel" and filename == "drawing_data.xlsx":
@@ -225,23 +222,21 @@ def register_export_tools(mcp):
                 if format_lower == "json":
                     selection_info = adapter.get_selection_info()
                     if selection_info["count"] == 0:
-                        return json.dumps(
+                        return dumps_result(
                             {
                                 "success": True,
                                 "count": 0,
                                 "message": "No entities selected",
                                 "entities": [],
-                            },
-                            indent=2,
+                            }
                         )
                 else:
                     if not adapter.has_selection():
-                        return json.dumps(
+                        return dumps_result(
                             {
                                 "success": False,
                                 "error": "No entities selected. Select entities first.",
-                            },
-                            indent=2,
+                            }
                         )
 
             # Extract data
@@ -250,28 +245,26 @@ def register_export_tools(mcp):
             if format_lower == "excel" and scope_lower == "all":
                 # Use adapter's built-in export for full drawing
                 success = adapter.export_to_excel(filename)
-                return json.dumps(
+                return dumps_result(
                     {
                         "success": success,
                         "message": (
                             f"Exported to {filename}" if success else "Export failed"
                         ),
-                    },
-                    indent=2,
+                    }
                 )
 
             # Extract data (for json output or selected excel)
             data = adapter.extract_drawing_data(only_selected=only_selected, limit=0)
 
             if not data:
-                return json.dumps(
+                return dumps_result(
                     {
                         "success": scope_lower == "all",
                         "count": 0,
                         "message": "No exportable data found",
                         "entities": [] if format_lower == "json" else None,
-                    },
-                    indent=2,
+                    }
                 )
 
             # JSON output
@@ -290,7 +283,7 @@ def register_export_tools(mcp):
                             "data": {"entities": data},
                         }
                     }
-                return json.dumps(result, indent=2)
+                return dumps_result(result)
 
             # Excel output (selected scope)
             scope_label = "Selected" if only_selected else "Drawing"
@@ -298,7 +291,6 @@ def register_export_tools(mcp):
 
         except Exception as e:
             logger.error(f"Export/extract failed: {e}")
-            return json.dumps(
-                {"success": False, "error": str(e), "count": 0},
-                indent=2,
+            return dumps_result(
+                {"success": False, "error": str(e), "count": 0}
             )
@@ -13,7 +13,6 @@ SHORTHAND FORMAT (one per line):
     switch|drawing_name           → switch|floor_plan.dwg
 """
 
-import json
 import logging
 import os
 from typing import Optional, Dict, Any, Callable, List, Tuple
@@ -21,6 +20,7 @@ from typing import Optional, Dict, Any, Callable, List, Tuple
 
 from core import get_config
 from mcp_tools.decorators import cad_tool, get_current_adapter
+from mcp_tools.helpers import dumps_result
 from mcp_tools.shorthand import parse_file_ops_input
 
 logger = logging.getLogger(__name__)
@@ -221,18 +221,18 @@ def register_file_tools(mcp):
         try:
             ops_data = parse_file_ops_input(operations)
         except Exception as e:
-            return json.dumps(
+            return dumps_result(
                 {
                     "success": False,
                     "error": f"Invalid input: {str(e)}",
                     "total": 0,
                     "succeeded": 0,
                     "results": [],
-                },
-                indent=2,
+                }
             )
 
         results = []
+        succeeded = 0
 
         for i, spec in enumerate(ops_data):
             action = spec.get("action")
@@ -280,6 +280,8 @@ def register_file_tools(mcp):
             try:
                 result = handler(spec)
                 results.append({"index": i, "action": action_lower, **result})
+                if result.get("success"):
+                    succeeded += 1
             except Exception as e:
                 logger.error(f"Error in file op {i} ({action_lower}): {e}")
                 results.append(
@@ -291,11 +293,10 @@ def register_file_tools(mcp):
                     }
                 )
 
-        return json.dumps(
+        return dumps_result(
             {
                 "total": len(ops_data),
-                "succeeded": sum(1 for r in results if r.get("success")),
+                "succeeded": succeeded,
                 "results": results,
-            },
-            indent=2,
+            }
         )
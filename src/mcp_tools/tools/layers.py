@@ -15,7 +15,6 @@ SHORTHAND FORMAT (one per line):
     info                          → info
 """
 
-import json
 import logging
 from typing import Optional, Dict, Any, Callable, List, Tuple
 
@@ -23,7 +22,9 @@ from typing import Optional, Dict, Any, Callable, List, Tuple
 from pydantic import ValidationError
 
 from core.models import CreateLayerRequest
+from mcp_tools.constants import DEFAULT_COLOR, DEFAULT_LINEWEIGHT
 from mcp_tools.decorators import cad_tool, get_current_adapter
+from mcp_tools.helpers import dumps_result
 from mcp_tools.shorthand import parse_layer_ops_input
 
 logger = logging.getLogger(__name__)
@@ -36,6 +37,9 @@ def _parse_layer_names(raw: Any) -> List[str]:
     """Parse layer names from string array or object array formats."""
     if not isinstance(raw, list):
         raw = [raw]
+    # Fast path: shorthand parsing already yields a plain list of strings
+    if all(type(item) is str for item in raw):
+        return raw
     names = []
     for item in raw:
         if isinstance(item, str):
@@ -60,8 +64,8 @@ def _create(spec: Dict[str, Any]) -> Dict[str, Any]:
     """
     validated = CreateLayerRequest(
         name=spec["name"],
-        color=spec.get("color", "white"),
-        lineweight=spec.get("lineweight", 25),
+        color=spec.get("color", DEFAULT_COLOR),
+        lineweight=spec.get("lineweight", DEFAULT_LINEWEIGHT),
     )
     success = get_current_adapter().create_layer(
         validated.name, validated.color, validated.lineweight
@@ -108,11 +112,13 @@ def _turn_on(spec: Dict[str, Any]) -> Dict[str, Any]:
         Dict with keys: success (bool), count (int), layers (list).
     """
     names = _parse_layer_names(spec["names"])
+    turn_on = get_current_adapter().turn_layer_on
     results = []
+    ok = 0
     for name in names:
-        success = get_current_adapter().turn_layer_on(name)
+        success = turn_on(name)
         results.append({"name": name, "success": success})
-    ok = sum(1 for r in results if r["success"])
+        ok += success
     return {"success": ok == len(names), "count": ok, "layers": results}
 
 
@@ -126,11 +132,13 @@ def _turn_off(spec: Dict[str, Any]) -> Dict[str, Any]:
         Dict with keys: success (bool), count (int), layers (list).
     """
     names = _parse_layer_names(spec["names"])
+    turn_off = get_current_adapter().turn_layer_off
     results = []
+    ok = 0
     for name in names:
-        success = get_current_adapter().turn_layer_off(name)
+        success = turn_off(name)
         results.append({"name": name, "success": success})
-    ok = sum(1 for r in results if r["success"])
+        ok += success
     return {"success": ok == len(names), "count": ok, "layers": results}
 
 
@@ -194,6 +202,11 @@ def _info(spec: Dict[str, Any]) -> Dict[str, Any]:
     adapter = get_current_adapter()
     layer_names = adapter.list_layers()
 
+    try:
+        doc = adapter.get_document()
+    except Exception:
+        doc = None
+
     layers = []
     for name in layer_names:
         try:
@@ -202,7 +215,6 @@ def _info(spec: Dict[str, Any]) -> Dict[str, Any]:
                 "on": adapter.is_layer_on(name),
             }
             try:
-                doc = adapter.get_document()
                 layer = doc.Layers.Item(name)
                 layer_info["color"] = layer.color
                 layer_info["locked"] = layer.Lock
@@ -305,18 +317,18 @@ def register_layer_tools(mcp):
         try:
             ops_data = parse_layer_ops_input(operations)
         except Exception as e:
-            return json.dumps(
+            return dumps_result(
                 {
                     "success": False,
                     "error": f"Invalid input: {str(e)}",
                     "total": 0,
                     "succeeded": 0,
                     "results": [],
-                },
-                indent=2,
+                }
             )
 
         results = []
+        succeeded = 0
 
         for i, spec in enumerate(ops_data):
             action = spec.get("action")
@@ -364,6 +376,8 @@ def register_layer_tools(mcp):
             try:
                 result = handler(spec)
                 results.append({"index": i, "action": action_lower, **result})
+                if result.get("success"):
+                    succeeded += 1
             except ValidationError as e:
                 error_msg = f"Validation error: {e.errors()[0]['msg']}"
                 logger.error(
@@ -388,11 +402,10 @@ def register_layer_tools(mcp):
                     }
                 )
 
-        return json.dumps(
+        return dumps_result(
             {
                 "total": len(ops_data),
-                "succeeded": sum(1 for r in results if r.get("success")),
+                "succeeded": succeeded,
                 "results": results,
-            },
-            indent=2,
+            }
         )
@@ -15,6 +15,7 @@ from typing import Optional, Dict, Any, Callable, List, Tuple
 
 
 from core import get_supported_cads, CADConnectionError, get_config
+from mcp_tools.helpers import dumps_result, parse_json_list
 from adapters.adapter_manager import (
     get_cad_instances,
     get_adapter,
@@ -307,24 +308,20 @@ def register_session_tools(mcp):
             JSON result with per-operation status
         """
         try:
-            ops_data = (
-                json.loads(operations) if isinstance(operations, str) else operations
-            )
-            if not isinstance(ops_data, list):
-                ops_data = [ops_data]
+            ops_data = parse_json_list(operations)
         except json.JSONDecodeError as e:
-            return json.dumps(
+            return dumps_result(
                 {
                     "success": False,
                     "error": f"Invalid JSON input: {str(e)}",
                     "total": 0,
                     "succeeded": 0,
                     "results": [],
-                },
-                indent=2,
+                }
             )
 
         results = []
+        succeeded = 0
 
         for i, spec in enumerate(ops_data):
             action = spec.get("action")
@@ -372,6 +369,8 @@ def register_session_tools(mcp):
             try:
                 result = handler(spec)
                 results.append({"index": i, "action": action_lower, **result})
+                if result.get("success"):
+                    succeeded += 1
             except CADConnectionError as e:
                 logger.error(f"Connection error in op {i} ({action_lower}): {e}")
                 results.append(
@@ -393,11 +392,10 @@ def register_session_tools(mcp):
                     }
                 )
 
-        return json.dumps(
+        return dumps_result(
             {
                 "total": len(ops_data),
-                "succeeded": sum(1 for r in results if r.get("success")),
+                "succeeded": succeeded,
                 "results": results,
-            },
-            indent=2,
+            }
         )
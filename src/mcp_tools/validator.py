@@ -46,6 +46,12 @@ COLOR_ALIASES = {
     "teal": "cyan",
 }
 
+# Derived once at import: alias names for fuzzy matching and the
+# valid-color listing used in error messages.
+_COLOR_ALIAS_NAMES = list(COLOR_ALIASES)
+_VALID_COLOR_SET = frozenset(VALID_COLORS)
+_VALID_COLORS_DISPLAY = ", ".join(VALID_COLORS)
+
 
 def fuzzy_match_color(color_input: str, threshold: float = 0.6) -> str:
     """
@@ -61,10 +67,14 @@ def fuzzy_match_color(color_input: str, threshold: float = 0.6) -> str:
     if not isinstance(color_input, str):
         return str(color_input)
 
-    color_lower = color_input.lower().strip()
+    # Avoid allocating a lowercased copy when the input already is one
+    # (the common case for spec fields that went through autocorrect).
+    color_lower = color_input.strip()
+    if not color_lower.islower():
+        color_lower = color_lower.lower()
 
     # Direct match
-    if color_lower in VALID_COLORS:
+    if color_lower in _VALID_COLOR_SET:
         return color_lower
 
     # Alias match
@@ -88,7 +98,7 @@ def fuzzy_match_color(color_input: str, threshold: float = 0.6) -> str:
 
     # Check aliases with fuzzy matching
     alias_matches = difflib.get_close_matches(
-        color_lower, list(COLOR_ALIASES.keys()), n=1, cutoff=threshold
+        color_lower, _COLOR_ALIAS_NAMES, n=1, cutoff=threshold
     )
 
     if alias_matches:
@@ -183,7 +193,7 @@ def normalize_coordinate(coord: Any) -> str:
         return ",".join(parts)
 
     if isinstance(coord, (list, tuple)):
-        return ",".join(str(c) for c in coord)
+        return ",".join([str(c) for c in coord])
 
     return str(coord)
 
@@ -191,7 +201,7 @@ def normalize_coordinate(coord: Any) -> str:
 # ========== Spec Auto-Correction ==========
 
 # Fields that should be numbers
-NUMERIC_FIELDS = {
+NUMERIC_FIELDS = frozenset({
     "radius",
     "height",
     "start_angle",
@@ -206,16 +216,16 @@ NUMERIC_FIELDS = {
     "center_x",
     "center_y",
     "angle",
-}
+})
 
 # Fields that should be colors
-COLOR_FIELDS = {"color"}
+COLOR_FIELDS = frozenset({"color"})
 
 # Fields that should be booleans
-BOOL_FIELDS = {"closed", "save_changes"}
+BOOL_FIELDS = frozenset({"closed", "save_changes"})
 
 # Fields that are coordinates
-COORDINATE_FIELDS = {
+COORDINATE_FIELDS = frozenset({
     "start",
     "end",
     "center",
@@ -224,6 +234,16 @@ COORDINATE_FIELDS = {
     "position",
     "insertion_point",
     "base_point",
+})
+
+# Single field -> corrector map derived from the category sets above, so
+# autocorrect_spec does one dict lookup per field instead of probing up to
+# four sets in sequence.
+_FIELD_CORRECTORS = {
+    **{f: coerce_number for f in NUMERIC_FIELDS},
+    **{f: fuzzy_match_color for f in COLOR_FIELDS},
+    **{f: coerce_bool for f in BOOL_FIELDS},
+    **{f: normalize_coordinate for f in COORDINATE_FIELDS},
 }
 
 
@@ -244,25 +264,13 @@ def autocorrect_spec(spec: Dict[str, Any], context: str = "") -> Dict[str, Any]:
     corrected = {}
 
     for key, value in spec.items():
-        # Normalize key to lowercase
-        key_lower = key.lower()
-
-        # Apply type-specific corrections
-        if key_lower in NUMERIC_FIELDS:
-            corrected[key_lower] = coerce_number(value, key_lower)
-
-        elif key_lower in COLOR_FIELDS:
-            corrected[key_lower] = fuzzy_match_color(value)
+        # Normalize key to lowercase (no copy when already lowercase,
+        # which is every key produced by the shorthand parsers)
+        key_lower = key if key.islower() else key.lower()
 
-        elif key_lower in BOOL_FIELDS:
-            corrected[key_lower] = coerce_bool(value)
-
-        elif key_lower in COORDINATE_FIELDS:
-            corrected[key_lower] = normalize_coordinate(value)
-
-        else:
-            # Pass through other fields with lowercase key
-            corrected[key_lower] = value
+        # Apply type-specific corrections; unknown fields pass through
+        corrector = _FIELD_CORRECTORS.get(key_lower)
+        corrected[key_lower] = corrector(value) if corrector else value
 
     return corrected
 
@@ -285,11 +293,15 @@ def validate_color(color: str) -> Optional[str]:
 
     color_lower = color.lower()
 
-    # Check if it's a valid color or can be fuzzy-matched
+    # Fast path: exact colors and known aliases are valid as-is
+    if color_lower in _VALID_COLOR_SET or color_lower in COLOR_ALIASES:
+        return None
+
+    # Check if it can be fuzzy-matched
     corrected = fuzzy_match_color(color_lower)
 
-    if corrected != color_lower and corrected not in VALID_COLORS:
-        return f"Unknown color '{color}'. Valid colors: {', '.join(VALID_COLORS)}"
+    if corrected != color_lower and corrected not in _VALID_COLOR_SET:
+        return f"Unknown color '{color}'. Valid colors: {_VALID_COLORS_DISPLAY}"
 
     return None
 
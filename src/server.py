@@ -26,10 +26,7 @@ from mcp_tools.tools import (
 )
 from web.api import api_app, log_handler
 
-# Setup at module load
-setup_utf8_encoding()
-logger = setup_logging()
-logging.getLogger().addHandler(log_handler)
+logger = logging.getLogger(__name__)
 
 # Initialize FastMCP server
 mcp = FastMCP(name=__title__)
@@ -73,19 +70,27 @@ def register_all_tools():
     logger.info("All MCP tools registered successfully")
 
 
-# Register tools at module load
-register_all_tools()
+def main():
+    """Initialize the runtime and serve MCP requests.
 
-# CAD connection is lazy-loaded on first tool use
-logger.info(f"Starting multiCAD-MCP server v{__version__}...")
-logger.info(f"Supported CAD types: {', '.join(get_supported_cads())}")
-logger.info("CAD applications will be connected on first tool use (lazy loading)")
-
-
-if __name__ == "__main__":
+    All side effects (encoding, logging, tool registration, transport
+    startup) happen here rather than at import, so importing this module
+    stays cheap and free of filesystem/log setup.
+    """
     import threading
     import uvicorn
 
+    setup_utf8_encoding()
+    setup_logging()
+    logging.getLogger().addHandler(log_handler)
+
+    register_all_tools()
+
+    # CAD connection is lazy-loaded on first tool use
+    logger.info(f"Starting multiCAD-MCP server v{__version__}...")
+    logger.info(f"Supported CAD types: {', '.join(get_supported_cads())}")
+    logger.info("CAD applications will be connected on first tool use (lazy loading)")
+
     # Configuration from config.json
     config = get_config()
     host = config.dashboard.host
@@ -129,3 +134,7 @@ if __name__ == "__main__":
     except Exception as e:
         logger.error(f"Server error: {e}", exc_info=True)
         sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
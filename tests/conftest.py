@@ -6,9 +6,48 @@ This allows tests to use absolute imports like "from core import ..."
 which work when the server is running.
 """
 
+import gc
 import sys
 from pathlib import Path
 
-# Add src directory to path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+import pytest
+
+# Add src directory to path (only once; repeated pytest invocations in the
+# same process, e.g. under pytest-xdist or IDE runners, re-import conftest)
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _disable_gc():
+    """Turn off the cyclic GC for the whole run.
+
+    The suite churns through many short-lived dicts and tuples (JSON
+    fixtures, parsed specs), and mid-test generational collections only
+    add timing jitter. gc.freeze() parks everything imported so far in
+    the permanent generation so the final collect has less to scan, and
+    the automatic collector is re-enabled on the way out.
+    """
+    gc.collect()
+    gc.freeze()
+    gc.disable()
+    yield
+    gc.enable()
+    gc.unfreeze()
+    gc.collect()
+
+
+@pytest.fixture(scope="session")
+def autocad_adapter():
+    """Shared AutoCADAdapter instance for tests that never connect.
+
+    The adapter constructor does no COM work, and the tests that use this
+    fixture only patch it through context managers, so one instance can be
+    reused for the whole session instead of being rebuilt per test.
+    Imported lazily so that test files which do not touch the adapters
+    still collect on platforms without pywin32.
+    """
+    from src.adapters import AutoCADAdapter
+
+    return AutoCADAdapter("autocad")
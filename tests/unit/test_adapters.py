@@ -6,7 +6,110 @@ Tests adapter interface implementation and context managers.
 import pytest
 from unittest.mock import MagicMock, patch, Mock, PropertyMock
 from src.adapters import AutoCADAdapter
+from src.adapters.autocad_adapter import SelectionSetManager, com_session
 from src.core import CADInterface
+from src.core.cad_interface import Color, LineWeight
+from core.exceptions import (
+    CADConnectionError,
+    CADOperationError,
+    InvalidParameterError,
+)
+
+
+# Every CAD dialect the adapter is expected to drive over COM
+CAD_TYPES = ("autocad", "zwcad", "gcad", "bricscad")
+
+# Mocked extraction results shared by the export_to_excel tests
+EXPORT_DRAWING_DATA = [
+    {
+        "Handle": "A1B2C3D4",
+        "ObjectType": "AcDbLine",
+        "Layer": "0",
+        "Color": "red",
+        "Length": "100.500",
+        "Area": "0.000",
+        "Name": "",
+    },
+    {
+        "Handle": "E5F6G7H8",
+        "ObjectType": "AcDbCircle",
+        "Layer": "1",
+        "Color": "blue",
+        "Length": "314.159",
+        "Area": "7853.981",
+        "Name": "",
+    },
+]
+
+EXPORT_LAYERS_INFO = [
+    {
+        "Name": "0", "ObjectCount": 1, "Color": "white",
+        "Linetype": "Continuous", "Lineweight": "Default",
+        "IsLocked": False, "IsVisible": True,
+    },
+    {
+        "Name": "1", "ObjectCount": 0, "Color": "red",
+        "Linetype": "Continuous", "Lineweight": "Default",
+        "IsLocked": False, "IsVisible": True,
+    },
+    {
+        "Name": "MyLayer", "ObjectCount": 2, "Color": "blue",
+        "Linetype": "Dashed", "Lineweight": "0.5",
+        "IsLocked": True, "IsVisible": False,
+    },
+]
+
+# Methods every adapter must expose (the CADInterface contract)
+REQUIRED_METHODS = frozenset({
+    # Connection
+    "connect",
+    "disconnect",
+    "is_connected",
+    # Drawing
+    "draw_line",
+    "draw_circle",
+    "draw_arc",
+    "draw_rectangle",
+    "draw_polyline",
+    "draw_ellipse",
+    "draw_text",
+    "draw_hatch",
+    "add_dimension",
+    # Layers
+    "create_layer",
+    "set_current_layer",
+    "get_current_layer",
+    "list_layers",
+    # Files
+    "save_drawing",
+    "open_drawing",
+    "new_drawing",
+    # View
+    "zoom_extents",
+    "refresh_view",
+    # Entity
+    "delete_entity",
+    "get_entity_properties",
+    "set_entity_properties",
+    # Data extraction
+    "extract_drawing_data",
+    "get_layers_info",
+})
+
+
+class _EntityStub:
+    """Minimal stand-in for a COM entity handled as an opaque item.
+
+    Used where the code under test only collects entities without reading
+    their properties: a plain slotted object is cheaper than a MagicMock
+    and, unlike one, raises on unexpected attribute access instead of
+    silently returning a new mock.
+    """
+
+    __slots__ = ("Handle",)
+
+    def __init__(self, handle: str):
+        self.Handle = handle
 
 
 class TestAdapterInstantiation:
@@ -18,18 +121,18 @@ class TestAdapterInstantiation:
         assert adapter is not None
         assert adapter.cad_type == "autocad"
 
-    def test_adapter_supports_multiple_cad_types(self):
+    @pytest.mark.parametrize("cad_type", CAD_TYPES)
+    def test_adapter_supports_multiple_cad_types(self, cad_type):
         """Test that AutoCADAdapter supports multiple CAD types."""
         # All should work with AutoCADAdapter
-        cad_types = ["autocad", "zwcad", "gcad", "bricscad"]
-        for cad_type in cad_types:
-            adapter = AutoCADAdapter(cad_type)
-            assert adapter.cad_type == cad_type
+        adapter = AutoCADAdapter(cad_type)
+        assert adapter.cad_type == cad_type
 
-    def test_adapter_case_insensitive(self):
+    @pytest.mark.parametrize("cad_type", CAD_TYPES)
+    def test_adapter_case_insensitive(self, cad_type):
         """Test that cad_type is case-insensitive."""
-        adapter1 = AutoCADAdapter("autocad")
-        adapter2 = AutoCADAdapter("AUTOCAD")
+        adapter1 = AutoCADAdapter(cad_type)
+        adapter2 = AutoCADAdapter(cad_type.upper())
         assert adapter1.cad_type == adapter2.cad_type
 
 
@@ -57,14 +160,12 @@ class TestContextManagers:
 
         with patch.object(adapter, "connect", return_value=False):
             # Should raise CADConnectionError if connection fails
-            from core.exceptions import CADConnectionError
             with pytest.raises(CADConnectionError):
                 with adapter as ctx_adapter:
                     pass
 
     def test_com_session_context_manager(self):
         """Test that com_session properly initializes/uninitializes COM."""
-        from src.adapters.autocad_adapter import com_session
         import sys
 
         if sys.platform != "win32":
@@ -84,7 +185,6 @@ class TestContextManagers:
 
     def test_selection_set_manager_creates_and_deletes(self):
         """Test that SelectionSetManager creates and deletes selection sets."""
-        from src.adapters.autocad_adapter import SelectionSetManager
 
         mock_document = MagicMock()
         mock_ss = MagicMock()
@@ -100,7 +200,6 @@ class TestContextManagers:
 
     def test_selection_set_manager_handles_existing(self):
         """Test that SelectionSetManager deletes existing selection set."""
-        from src.adapters.autocad_adapter import SelectionSetManager
 
         mock_document = MagicMock()
         mock_existing_ss = MagicMock()
@@ -123,7 +222,6 @@ class TestCADInterfaceContract:
 
     def test_adapter_implements_cad_interface(self):
         """Test that AutoCADAdapter implements CADInterface."""
-        from src.adapters.autocad_adapter import AutoCADAdapter
 
         # Verify adapter inherits from CADInterface (check in MRO)
         mro_names = [c.__name__ for c in AutoCADAdapter.__mro__]
@@ -132,106 +230,65 @@ class TestCADInterfaceContract:
         # Also check that adapter has the ABC.ABCMeta metaclass (from CADInterface)
         assert hasattr(AutoCADAdapter, '__abstractmethods__'), "AutoCADAdapter should have __abstractmethods__ from ABC"
 
-    def test_adapter_has_required_methods(self):
+    def test_adapter_has_required_methods(self, autocad_adapter):
         """Test that adapter has all required interface methods."""
-        required_methods = [
-            # Connection
-            "connect",
-            "disconnect",
-            "is_connected",
-            # Drawing
-            "draw_line",
-            "draw_circle",
-            "draw_arc",
-            "draw_rectangle",
-            "draw_polyline",
-            "draw_ellipse",
-            "draw_text",
-            "draw_hatch",
-            "add_dimension",
-            # Layers
-            "create_layer",
-            "set_current_layer",
-            "get_current_layer",
-            "list_layers",
-            # Files
-            "save_drawing",
-            "open_drawing",
-            "new_drawing",
-            # View
-            "zoom_extents",
-            "refresh_view",
-            # Entity
-            "delete_entity",
-            "get_entity_properties",
-            "set_entity_properties",
-            # Data extraction
-            "extract_drawing_data",
-            "get_layers_info",
-        ]
-
-        adapter = AutoCADAdapter("autocad")
-        for method in required_methods:
-            assert hasattr(
-                adapter, method
-            ), f"AutoCADAdapter missing {method}"
+        # One set difference reports every missing method at once
+        missing = {m for m in REQUIRED_METHODS if not hasattr(autocad_adapter, m)}
+        assert not missing, f"AutoCADAdapter missing {sorted(missing)}"
 
 
 class TestCoordinateNormalization:
     """Test suite for coordinate normalization."""
 
-    def test_normalize_2d_coordinate(self):
-        """Test normalization of 2D coordinates."""
-        result = CADInterface.normalize_coordinate((10, 20))
-        assert result == (10.0, 20.0, 0.0)
-
-    def test_normalize_3d_coordinate(self):
-        """Test normalization of 3D coordinates."""
-        result = CADInterface.normalize_coordinate((10, 20, 30))
-        assert result == (10.0, 20.0, 30.0)
-
-    def test_normalize_coordinate_converts_to_float(self):
-        """Test that normalize_coordinate converts to float."""
-        result = CADInterface.normalize_coordinate((10, 20))
-        assert isinstance(result[0], float)
-        assert isinstance(result[1], float)
-        assert isinstance(result[2], float)
-
-    def test_normalize_coordinate_invalid_raises(self):
+    @pytest.mark.parametrize(
+        "coord,expected",
+        [
+            ((10, 20), (10.0, 20.0, 0.0)),  # 2D padded with z=0
+            ((10, 20, 30), (10.0, 20.0, 30.0)),  # 3D passthrough
+        ],
+    )
+    def test_normalize_coordinate(self, coord, expected):
+        """Test normalization of 2D and 3D coordinates."""
+        result = CADInterface.normalize_coordinate(coord)
+        assert result == expected
+        assert all(isinstance(c, float) for c in result)
+
+    @pytest.mark.parametrize(
+        "coord",
+        [
+            (10,),  # Only 1 dimension
+            (10, 20, 30, 40),  # Too many dimensions
+        ],
+    )
+    def test_normalize_coordinate_invalid_raises(self, coord):
         """Test invalid coordinate raises error."""
         with pytest.raises(ValueError):
-            # Only 1 dimension - type: ignore
-            CADInterface.normalize_coordinate((10,))  # type: ignore
+            CADInterface.normalize_coordinate(coord)  # type: ignore
 
-        with pytest.raises(ValueError):
-            # Too many dimensions - type: ignore
-            CADInterface.normalize_coordinate((10, 20, 30, 40))  # type: ignore
 
 class TestLineWeightValidation:
     """Test suite for lineweight validation."""
 
-    def test_valid_lineweight_accepted(self):
+    @pytest.mark.parametrize("weight", [0, 5, 9, 13, 15, 18, 20, 25, 30, 100, 211])
+    def test_valid_lineweight_accepted(self, autocad_adapter, weight):
         """Test that valid lineweights are accepted."""
-        adapter = AutoCADAdapter("autocad")
-        valid_weights = [0, 5, 9, 13, 15, 18, 20, 25, 30, 100, 211]
-        for weight in valid_weights:
-            assert adapter.validate_lineweight(weight) == weight
+        adapter = autocad_adapter
+        assert adapter.validate_lineweight(weight) == weight
 
-    def test_invalid_lineweight_returns_default(self):
+    def test_invalid_lineweight_returns_default(self, autocad_adapter):
         """Test that invalid lineweights return default."""
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
         result = adapter.validate_lineweight(999)
         assert result == 0  # Default thin line
 
-    def test_lineweight_is_valid_check(self):
+    @pytest.mark.parametrize(
+        "weight,expected",
+        [(0, True), (50, True), (211, True), (999, False), (-1, False)],
+    )
+    def test_lineweight_is_valid_check(self, weight, expected):
         """Test lineweight validity check."""
-        from src.core.cad_interface import LineWeight
 
-        assert LineWeight.is_valid(0) is True
-        assert LineWeight.is_valid(50) is True
-        assert LineWeight.is_valid(211) is True
-        assert LineWeight.is_valid(999) is False
-        assert LineWeight.is_valid(-1) is False
+        assert LineWeight.is_valid(weight) is expected
 
 
 class TestColorEnums:
@@ -239,24 +296,20 @@ class TestColorEnums:
 
     def test_color_enum_has_standard_colors(self):
         """Test that Color enum has standard colors."""
-        from src.core.cad_interface import Color
 
-        assert hasattr(Color, "BLACK")
-        assert hasattr(Color, "RED")
-        assert hasattr(Color, "GREEN")
-        assert hasattr(Color, "BLUE")
-        assert hasattr(Color, "WHITE")
+        # Set difference reports every missing color at once
+        missing = {"BLACK", "RED", "GREEN", "BLUE", "WHITE"} - Color.__members__.keys()
+        assert not missing, f"Color enum missing {sorted(missing)}"
 
     def test_color_enum_values_are_rgb_tuples(self):
         """Test that color values are RGB tuples."""
-        from src.core.cad_interface import Color
 
-        for color in Color:
-            assert isinstance(color.value, tuple)
-            assert len(color.value) == 3
-            # Check RGB values are in valid range
-            for component in color.value:
-                assert 0 <= component <= 255
+        assert all(
+            isinstance(color.value, tuple)
+            and len(color.value) == 3
+            and all(0 <= component <= 255 for component in color.value)
+            for color in Color
+        )
 
 
 class TestRefreshViewUndoRedo:
@@ -270,7 +323,6 @@ class TestRefreshViewUndoRedo:
         2. SendCommand with REDRAW (most reliable visual update)
         3. Window click simulation (forces UI update)
         """
-        from src.adapters.autocad_adapter import AutoCADAdapter
 
         adapter = AutoCADAdapter("autocad")
 
@@ -295,41 +347,22 @@ class TestRefreshViewUndoRedo:
             # Technique 3: Window click simulation
             mock_click.assert_called_once()
 
-    def test_undo_does_not_call_refresh_view(self):
-        """Test that undo() does not call refresh_view().
-
-        Removing refresh_view from undo/redo avoids contaminating
-        the undo/redo stack with extra refresh commands.
-        """
-        from src.adapters.autocad_adapter import AutoCADAdapter
-
-        adapter = AutoCADAdapter("autocad")
-
-        with patch.object(adapter, "_validate_connection"), patch.object(
-            adapter, "_get_application"
-        ) as mock_get_app, patch.object(adapter, "refresh_view") as mock_refresh:
-
-            mock_app = MagicMock()
-            mock_get_app.return_value = mock_app
-
-            # Call undo
-            result = adapter.undo(count=1)
-
-            assert result is True
-            # Verify refresh_view was NOT called
-            mock_refresh.assert_not_called()
-            # Verify undo command was sent
-            mock_app.ActiveDocument.SendCommand.assert_called_once_with("_undo 1\n")
-
-    def test_redo_does_not_call_refresh_view(self):
-        """Test that redo() does not call refresh_view().
+    @pytest.mark.parametrize(
+        "method,expected_command",
+        [
+            ("undo", "_undo 1\n"),
+            ("redo", "_redo 1\n"),
+        ],
+    )
+    def test_undo_redo_do_not_call_refresh_view(
+        self, autocad_adapter, method, expected_command
+    ):
+        """Test that undo()/redo() do not call refresh_view().
 
         Removing refresh_view from undo/redo avoids contaminating
         the undo/redo stack with extra refresh commands.
         """
-        from src.adapters.autocad_adapter import AutoCADAdapter
-
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         with patch.object(adapter, "_validate_connection"), patch.object(
             adapter, "_get_application"
@@ -338,24 +371,53 @@ class TestRefreshViewUndoRedo:
             mock_app = MagicMock()
             mock_get_app.return_value = mock_app
 
-            # Call redo
-            result = adapter.redo(count=1)
+            result = getattr(adapter, method)(count=1)
 
             assert result is True
             # Verify refresh_view was NOT called
             mock_refresh.assert_not_called()
-            # Verify redo command was sent
-            mock_app.ActiveDocument.SendCommand.assert_called_once_with("_redo 1\n")
+            # Verify the undo/redo command was sent
+            mock_app.ActiveDocument.SendCommand.assert_called_once_with(
+                expected_command
+            )
 
 
 class TestDataExport:
     """Test suite for drawing data extraction and export."""
 
-    def test_extract_drawing_data_returns_list(self):
-        """Test that extract_drawing_data returns a list of dictionaries."""
-        from src.adapters.autocad_adapter import AutoCADAdapter
+    @pytest.fixture
+    def mock_doc(self):
+        """Bare document mock handed to extraction internals."""
+        return MagicMock()
 
-        adapter = AutoCADAdapter("autocad")
+    @pytest.fixture
+    def make_entity(self):
+        """Factory for COM entity mocks with the attributes extraction reads.
+
+        Keyword arguments override the defaults, so each test states only
+        the properties it actually asserts on.
+        """
+        def _make(**attrs):
+            entity = MagicMock()
+            entity.Handle = "A1B2C3D4"
+            entity.ObjectName = "AcDbLine"
+            entity.Layer = "0"
+            entity.Color = 1
+            entity.Length = 0.0
+            entity.Area = 0.0
+            entity.Radius = 0.0
+            entity.Name = ""
+            for name, value in attrs.items():
+                setattr(entity, name, value)
+            return entity
+
+        return _make
+
+    def test_extract_drawing_data_returns_list(
+        self, autocad_adapter, mock_doc, make_entity
+    ):
+        """Test that extract_drawing_data returns a list of dictionaries."""
+        adapter = autocad_adapter
 
         with patch.object(adapter, "_validate_connection"), patch.object(
             adapter, "_get_document"
@@ -363,21 +425,9 @@ class TestDataExport:
             adapter, "_get_entities_to_process"
         ) as mock_get_entities:
 
-            # Mock entity with properties
-            mock_entity = MagicMock()
-            mock_entity.Handle = "A1B2C3D4"
-            mock_entity.ObjectName = "AcDbLine"
-            mock_entity.Layer = "0"
-            mock_entity.Color = 1
-            mock_entity.Length = 100.0
-            mock_entity.Area = 0.0
-            mock_entity.Radius = 0.0
-            mock_entity.Name = ""
-
             # Mock _get_entities_to_process to return list of entities
-            mock_get_entities.return_value = [mock_entity]
+            mock_get_entities.return_value = [make_entity(Length=100.0)]
 
-            mock_doc = MagicMock()
             mock_get_doc.return_value = mock_doc
 
             result = adapter.extract_drawing_data()
@@ -390,11 +440,11 @@ class TestDataExport:
             # Verify _get_entities_to_process was called with only_selected=False
             mock_get_entities.assert_called_once_with(mock_doc, False)
 
-    def test_extract_drawing_data_handles_empty_drawing(self):
+    def test_extract_drawing_data_handles_empty_drawing(
+        self, autocad_adapter, mock_doc
+    ):
         """Test that extract_drawing_data handles empty drawings."""
-        from src.adapters.autocad_adapter import AutoCADAdapter
-
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         with patch.object(adapter, "_validate_connection"), patch.object(
             adapter, "_get_document"
@@ -405,7 +455,6 @@ class TestDataExport:
             # Mock empty entity list
             mock_get_entities.return_value = []
 
-            mock_doc = MagicMock()
             mock_get_doc.return_value = mock_doc
 
             result = adapter.extract_drawing_data()
@@ -413,11 +462,11 @@ class TestDataExport:
             assert isinstance(result, list)
             assert len(result) == 0
 
-    def test_extract_drawing_data_with_only_selected(self):
+    def test_extract_drawing_data_with_only_selected(
+        self, autocad_adapter, mock_doc, make_entity
+    ):
         """Test that extract_drawing_data respects only_selected parameter."""
-        from src.adapters.autocad_adapter import AutoCADAdapter
-
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         with patch.object(adapter, "_validate_connection"), patch.object(
             adapter, "_get_document"
@@ -426,19 +475,16 @@ class TestDataExport:
         ) as mock_get_entities:
 
             # Mock selected entity
-            mock_entity = MagicMock()
-            mock_entity.Handle = "SELECTED1"
-            mock_entity.ObjectName = "AcDbCircle"
-            mock_entity.Layer = "1"
-            mock_entity.Color = 5
-            mock_entity.Radius = 50.0
-            mock_entity.Length = 0.0
-            mock_entity.Area = 0.0
-            mock_entity.Name = ""
-
-            mock_get_entities.return_value = [mock_entity]
+            mock_get_entities.return_value = [
+                make_entity(
+                    Handle="SELECTED1",
+                    ObjectName="AcDbCircle",
+                    Layer="1",
+                    Color=5,
+                    Radius=50.0,
+                )
+            ]
 
-            mock_doc = MagicMock()
             mock_get_doc.return_value = mock_doc
 
             # Call with only_selected=True
@@ -450,269 +496,145 @@ class TestDataExport:
             # Verify _get_entities_to_process was called with only_selected=True
             mock_get_entities.assert_called_once_with(mock_doc, True)
 
-    def test_get_entities_to_process_uses_pickfirst_selection(self):
+    def test_get_entities_to_process_uses_pickfirst_selection(self, autocad_adapter):
         """Test that _get_entities_to_process uses PickfirstSelectionSet for selected entities."""
-        from src.adapters.autocad_adapter import AutoCADAdapter
 
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         # Mock document with PickfirstSelectionSet
         mock_doc = MagicMock()
         mock_selection = MagicMock()
         mock_selection.Count = 2
 
-        # Mock selected entities
-        mock_entity1 = MagicMock()
-        mock_entity1.Handle = "E1"
-        mock_entity2 = MagicMock()
-        mock_entity2.Handle = "E2"
+        # Stub selected entities (passed through without property reads)
+        entity1 = _EntityStub("E1")
+        entity2 = _EntityStub("E2")
 
-        mock_selection.Item.side_effect = [mock_entity1, mock_entity2]
+        mock_selection.Item.side_effect = [entity1, entity2]
         mock_doc.PickfirstSelectionSet = mock_selection
 
         # Call _get_entities_to_process with only_selected=True
         result = adapter._get_entities_to_process(mock_doc, only_selected=True)
 
         assert len(result) == 2
-        assert result[0] is mock_entity1
-        assert result[1] is mock_entity2
+        assert result[0] is entity1
+        assert result[1] is entity2
         # Verify PickfirstSelectionSet was accessed
         assert mock_selection.Item.call_count == 2
 
-    def test_get_entities_to_process_returns_all_from_modelspace(self):
+    def test_get_entities_to_process_returns_all_from_modelspace(self, autocad_adapter):
         """Test that _get_entities_to_process returns all entities from ModelSpace."""
-        from src.adapters.autocad_adapter import AutoCADAdapter
 
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         # Mock document with ModelSpace
         mock_doc = MagicMock()
         mock_model_space = MagicMock()
 
-        # Mock entities in ModelSpace
-        mock_entity1 = MagicMock()
-        mock_entity1.Handle = "E1"
-        mock_entity2 = MagicMock()
-        mock_entity2.Handle = "E2"
-        mock_entity3 = MagicMock()
-        mock_entity3.Handle = "E3"
+        # Stub entities in ModelSpace (passed through without property reads)
+        entities = [_EntityStub("E1"), _EntityStub("E2"), _EntityStub("E3")]
 
         # Make ModelSpace iterable
-        mock_model_space.__iter__.return_value = iter([mock_entity1, mock_entity2, mock_entity3])
+        mock_model_space.__iter__.return_value = iter(entities)
         mock_doc.ModelSpace = mock_model_space
 
         # Call _get_entities_to_process with only_selected=False
         result = adapter._get_entities_to_process(mock_doc, only_selected=False)
 
-        assert len(result) == 3
-        assert result[0] is mock_entity1
-        assert result[1] is mock_entity2
-        assert result[2] is mock_entity3
+        assert result == entities
 
-    def test_export_to_excel_handles_no_data(self):
+    def test_export_to_excel_handles_no_data(self, autocad_adapter, tmp_path):
         """Test that export_to_excel handles drawing with no data."""
-        from src.adapters.autocad_adapter import AutoCADAdapter
 
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
-        with patch.object(adapter, "extract_drawing_data") as mock_extract:
+        # Resolve into the per-test tmp_path so the test never creates the
+        # configured output directory (and cannot collide under xdist)
+        with patch.object(adapter, "extract_drawing_data") as mock_extract, patch.object(
+            adapter,
+            "resolve_export_path",
+            side_effect=lambda name, folder: str(tmp_path / name),
+        ):
 
             # Mock empty drawing data
             mock_extract.return_value = []
 
-            result = adapter.export_to_excel("/tmp/test.xlsx")
+            result = adapter.export_to_excel("test.xlsx")
 
-            # Should return False when there's no data
+            # Should return False when there's no data, and nothing written
             assert result is False
+            assert not (tmp_path / "test.xlsx").exists()
 
-    def test_export_to_excel_creates_file(self):
-        """Test that export_to_excel creates a valid Excel file."""
-        import os
-        from pathlib import Path
-        from src.adapters.autocad_adapter import AutoCADAdapter
-        from core import get_config
-
-        adapter = AutoCADAdapter("autocad")
+    @pytest.fixture(scope="class")
+    def exported_workbook(self, autocad_adapter):
+        """Workbook from a single export_to_excel run, shared by the
+        export tests below.
 
-        with patch.object(
-            adapter, "extract_drawing_data"
-        ) as mock_extract, patch.object(adapter, "get_layers_info") as mock_get_layers_info:
-
-            # Mock drawing data
-            mock_extract.return_value = [
-                {
-                    "Handle": "A1B2C3D4",
-                    "ObjectType": "AcDbLine",
-                    "Layer": "0",
-                    "Color": "red",
-                    "Length": "100.500",
-                    "Area": "0.000",
-                    "Name": "",
-                },
-                {
-                    "Handle": "E5F6G7H8",
-                    "ObjectType": "AcDbCircle",
-                    "Layer": "1",
-                    "Color": "blue",
-                    "Length": "314.159",
-                    "Area": "7853.981",
-                    "Name": "",
-                },
-            ]
+        The export is executed once per class instead of once per test,
+        and the save is redirected into an in-memory buffer so nothing
+        touches the configured output directory (no disk I/O, no cleanup,
+        safe to run in parallel).
+        """
+        from io import BytesIO
 
-            # Mock layers info
-            mock_get_layers_info.return_value = [
-                {
-                    "Name": "0", "ObjectCount": 1, "Color": "white",
-                    "Linetype": "Continuous", "Lineweight": "Default",
-                    "IsLocked": False, "IsVisible": True,
-                },
-                {
-                    "Name": "1", "ObjectCount": 0, "Color": "red",
-                    "Linetype": "Continuous", "Lineweight": "Default",
-                    "IsLocked": False, "IsVisible": True,
-                },
-                {
-                    "Name": "MyLayer", "ObjectCount": 2, "Color": "blue",
-                    "Linetype": "Dashed", "Lineweight": "0.5",
-                    "IsLocked": True, "IsVisible": False,
-                },
-            ]
+        # Skip (rather than error) when the optional dependency is absent
+        openpyxl = pytest.importorskip("openpyxl")
+        Workbook = openpyxl.Workbook
 
-            # Use filename that will be saved to configured output directory
-            filename = "test_export.xlsx"
-
-            try:
-                result = adapter.export_to_excel(filename)
-
-                # Should succeed if openpyxl is installed
-                assert result is True
-
-                # Get expected filepath
-                config = get_config()
-                output_dir = Path(config.output.directory).expanduser().resolve()
-                filepath = output_dir / "sheets" / filename
-
-                # File should exist
-                assert filepath.exists()
-                # File should have content
-                assert filepath.stat().st_size > 0
-            finally:
-                # Cleanup
-                config = get_config()
-                output_dir = Path(config.output.directory).expanduser().resolve()
-                filepath = output_dir / filename
-                if filepath.exists():
-                    filepath.unlink()
-
-    def test_export_to_excel_creates_layers_sheet(self):
-        """Test that export_to_excel creates a Layers sheet with detailed layer information."""
-        from pathlib import Path
-        from src.adapters.autocad_adapter import AutoCADAdapter
-        from core import get_config
-        from openpyxl import load_workbook
-
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
+        buffer = BytesIO()
+        real_save = Workbook.save
 
         with patch.object(
             adapter, "extract_drawing_data"
         ) as mock_extract, patch.object(
             adapter, "get_layers_info"
-        ) as mock_get_layers_info:
-
-            # Mock drawing data
-            mock_extract.return_value = [
-                {
-                    "Handle": "A1B2C3D4",
-                    "ObjectType": "AcDbLine",
-                    "Layer": "0",
-                    "Color": "red",
-                    "Length": "100.500",
-                    "Area": "0.000",
-                    "Name": "",
-                },
-            ]
-
-            # Mock layers info with detailed data
-            mock_get_layers_info.return_value = [
-                {
-                    "Name": "0",
-                    "ObjectCount": 1,
-                    "Color": "white",
-                    "Linetype": "Continuous",
-                    "Lineweight": "Default",
-                    "IsLocked": False,
-                    "IsVisible": True,
-                },
-                {
-                    "Name": "1",
-                    "ObjectCount": 0,
-                    "Color": "red",
-                    "Linetype": "Continuous",
-                    "Lineweight": "Default",
-                    "IsLocked": False,
-                    "IsVisible": True,
-                },
-                {
-                    "Name": "MyLayer",
-                    "ObjectCount": 2,
-                    "Color": "blue",
-                    "Linetype": "Dashed",
-                    "Lineweight": "0.5",
-                    "IsLocked": True,
-                    "IsVisible": False,
-                },
-            ]
+        ) as mock_get_layers_info, patch.object(
+            adapter, "resolve_export_path", side_effect=lambda name, folder: name
+        ), patch.object(
+            Workbook, "save", lambda wb, _filepath: real_save(wb, buffer)
+        ):
+            mock_extract.return_value = EXPORT_DRAWING_DATA
+            mock_get_layers_info.return_value = EXPORT_LAYERS_INFO
+
+            result = adapter.export_to_excel("test_export.xlsx")
+
+        # Should succeed if openpyxl is installed
+        assert result is True
+        buffer.seek(0)
+        return openpyxl.load_workbook(buffer)
+
+    def test_export_to_excel_creates_file(self, exported_workbook):
+        """Test that export_to_excel produces a valid workbook."""
+        sheet = exported_workbook["Drawing Data"]
+        # Header + one row per mocked entity
+        assert sheet.max_row == 1 + len(EXPORT_DRAWING_DATA)
+
+    def test_export_to_excel_creates_layers_sheet(self, exported_workbook):
+        """Test that export_to_excel creates a Layers sheet with detailed layer information."""
+        # Should have both Drawing Data and Layers sheets
+        sheet_names = exported_workbook.sheetnames
+        assert "Drawing Data" in sheet_names
+        assert "Layers" in sheet_names
+
+        # Check Layers sheet content: header + 3 layers, compared as row
+        # tuples (iter_rows reads each row in one pass instead of one
+        # cell() lookup per assertion)
+        layers_sheet = exported_workbook["Layers"]
+        rows = [
+            row[:3] for row in layers_sheet.iter_rows(max_row=4, values_only=True)
+        ]
+        assert rows == [
+            ("Name", "ObjectCount", "Color"),
+            ("0", 1, "white"),
+            ("1", 0, "red"),
+            ("MyLayer", 2, "blue"),
+        ]
 
-            filename = "test_layers.xlsx"
-
-            try:
-                result = adapter.export_to_excel(filename)
-                assert result is True
-
-                # Get expected filepath
-                config = get_config()
-                output_dir = Path(config.output.directory).expanduser().resolve()
-                filepath = output_dir / "sheets" / filename
-
-                # Load the workbook and check sheets
-                workbook = load_workbook(str(filepath))
-                sheet_names = workbook.sheetnames
-
-                # Should have both Drawing Data and Layers sheets
-                assert "Drawing Data" in sheet_names
-                assert "Layers" in sheet_names
-
-                # Check Layers sheet content
-                layers_sheet = workbook["Layers"]
-                # Header + 3 layers = 4 rows
-                assert layers_sheet.max_row >= 4
-                # Check headers
-                assert layers_sheet.cell(row=1, column=1).value == "Name"
-                assert layers_sheet.cell(row=1, column=2).value == "ObjectCount"
-                assert layers_sheet.cell(row=1, column=3).value == "Color"
-                # Check layer data (Name column)
-                assert layers_sheet.cell(row=2, column=1).value == "0"
-                assert layers_sheet.cell(row=3, column=1).value == "1"
-                assert layers_sheet.cell(row=4, column=1).value == "MyLayer"
-                # Check object counts
-                assert layers_sheet.cell(row=2, column=2).value == 1
-                assert layers_sheet.cell(row=3, column=2).value == 0
-                assert layers_sheet.cell(row=4, column=2).value == 2
-
-            finally:
-                # Cleanup
-                config = get_config()
-                output_dir = Path(config.output.directory).expanduser().resolve()
-                filepath = output_dir / "sheets" / filename
-                if filepath.exists():
-                    filepath.unlink()
-
-    def test_extract_drawing_data_structure(self):
+    def test_extract_drawing_data_structure(self, autocad_adapter):
         """Test that extract_drawing_data returns proper dict structure."""
-        from src.adapters.autocad_adapter import AutoCADAdapter
 
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         # extract_drawing_data returns list of dicts with entity data
         # We test that it returns empty list when disconnected (can't access real drawing)
@@ -734,11 +656,11 @@ class TestDataExport:
                 assert "Circumference" in entity_dict
                 assert "Name" in entity_dict
 
-    def test_color_map_reverse_in_extract_data(self):
+    def test_color_map_reverse_in_extract_data(self, autocad_adapter):
         """Test that color mapping works in extract_drawing_data."""
-        from src.adapters.autocad_adapter import AutoCADAdapter, COLOR_MAP
+        from src.adapters.autocad_adapter import COLOR_MAP
 
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         # Verify COLOR_MAP exists and has expected values
         assert isinstance(COLOR_MAP, dict)
@@ -751,7 +673,6 @@ class TestDataExport:
 
     def test_normalize_coordinate_utility(self):
         """Test that CADInterface.normalize_coordinate works properly."""
-        from core import CADInterface
 
         # Test 2D coordinate
         result_2d = CADInterface.normalize_coordinate((10.5, 20.5))
@@ -765,11 +686,10 @@ class TestDataExport:
 class TestLayersInfo:
     """Test suite for layer information extraction."""
 
-    def test_get_layers_info_with_entity_data_parameter(self):
+    def test_get_layers_info_with_entity_data_parameter(self, autocad_adapter):
         """Test that get_layers_info accepts pre-extracted entity_data to avoid re-iteration."""
-        from src.adapters.autocad_adapter import AutoCADAdapter
 
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         # Pre-extracted entity data
         entity_data = [
@@ -836,11 +756,10 @@ class TestLayersInfo:
             # Verify ModelSpace was NOT accessed (optimization)
             assert not hasattr(mock_doc, "ModelSpace") or not mock_doc.ModelSpace.called
 
-    def test_get_layers_info_without_entity_data_uses_selectionsets(self):
+    def test_get_layers_info_without_entity_data_uses_selectionsets(self, autocad_adapter):
         """Test that get_layers_info uses SelectionSets if entity_data not provided."""
-        from src.adapters.autocad_adapter import AutoCADAdapter
 
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         with patch.object(adapter, "_validate_connection"), patch.object(
             adapter, "_get_document"
@@ -909,9 +828,9 @@ class TestLayersInfo:
 class TestBlockCreation:
     """Test suite for block creation functionality."""
 
-    def test_create_block_from_entities_success(self):
+    def test_create_block_from_entities_success(self, autocad_adapter):
         """Test successful block creation from entity handles."""
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         # Mock COM objects
         mock_app = MagicMock()
@@ -955,9 +874,9 @@ class TestBlockCreation:
             mock_blocks.Add.assert_called_once()
             mock_doc.CopyObjects.assert_called_once()
 
-    def test_create_block_from_entities_duplicate_name(self):
+    def test_create_block_from_entities_duplicate_name(self, autocad_adapter):
         """Test that creating block with existing name raises error."""
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         # Mock COM objects
         mock_app = MagicMock()
@@ -970,23 +889,21 @@ class TestBlockCreation:
         mock_doc.Blocks = mock_blocks
         mock_blocks.Item.return_value = mock_existing_block  # Block exists (doesn't raise)
 
-        from core.exceptions import CADOperationError
 
         with patch.object(adapter, "_validate_connection"), \
              patch.object(adapter, "_get_application", return_value=mock_app):
 
-            with pytest.raises(CADOperationError) as exc_info:
+            # match handles the message check declaratively
+            with pytest.raises(CADOperationError, match="(?i)already exists"):
                 adapter.create_block_from_entities(
                     block_name="ExistingBlock",
                     entity_handles=["A1B2"],
                     insertion_point=(0.0, 0.0, 0.0)
                 )
 
-            assert "already exists" in str(exc_info.value).lower()
-
-    def test_create_block_from_entities_invalid_handles(self):
+    def test_create_block_from_entities_invalid_handles(self, autocad_adapter):
         """Test block creation with invalid entity handles."""
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         # Mock COM objects
         mock_app = MagicMock()
@@ -1024,9 +941,9 @@ class TestBlockCreation:
             assert len(result["failed_handles"]) == 1
             assert "INVALID" in result["failed_handles"]
 
-    def test_create_block_from_selection_success(self):
+    def test_create_block_from_selection_success(self, autocad_adapter):
         """Test successful block creation from selected entities."""
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         # Mock COM objects
         mock_app = MagicMock()
@@ -1070,9 +987,9 @@ class TestBlockCreation:
             mock_blocks.Add.assert_called_once()
             mock_doc.CopyObjects.assert_called_once()
 
-    def test_create_block_from_selection_no_selection(self):
+    def test_create_block_from_selection_no_selection(self, autocad_adapter):
         """Test that error is raised when no entities are selected."""
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         # Mock COM objects
         mock_app = MagicMock()
@@ -1087,24 +1004,20 @@ class TestBlockCreation:
         mock_blocks.Item.side_effect = Exception("Block doesn't exist")
         mock_selection.Count = 0  # No selection
 
-        from core.exceptions import CADOperationError
 
         with patch.object(adapter, "_validate_connection"), \
              patch.object(adapter, "_get_application", return_value=mock_app):
 
-            with pytest.raises(CADOperationError) as exc_info:
+            with pytest.raises(CADOperationError, match="No entities selected"):
                 adapter.create_block_from_selection(
                     block_name="EmptyBlock",
                     insertion_point=(0.0, 0.0, 0.0)
                 )
 
-            assert "No entities selected" in str(exc_info.value)
-
-    def test_create_block_from_entities_invalid_name(self):
+    def test_create_block_from_entities_invalid_name(self, autocad_adapter):
         """Test that invalid block name raises error."""
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
-        from core.exceptions import InvalidParameterError
 
         # Mock COM objects
         mock_app = MagicMock()
@@ -1127,9 +1040,9 @@ class TestBlockCreation:
                     entity_handles=["A1B2"]
                 )
 
-    def test_objects_to_variant_array_helper(self):
+    def test_objects_to_variant_array_helper(self, autocad_adapter):
         """Test _objects_to_variant_array helper method."""
-        adapter = AutoCADAdapter("autocad")
+        adapter = autocad_adapter
 
         # Mock COM objects
         mock_obj1 = MagicMock()
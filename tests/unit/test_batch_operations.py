@@ -4,224 +4,286 @@ Tests batch functionality for drawing, layers, and entity operations.
 """
 
 import json
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import pytest
+from jsonschema.validators import Draft202012Validator, extend
+
+# Fastest available JSON backend for these small fixtures: orjson, then
+# rapidjson, then the stdlib — each step degrades transparently when the
+# faster library is not installed. Every backend sorts keys so the
+# payloads are canonical, and the orjson path keeps the output as bytes —
+# its parser takes bytes directly, saving a UTF-8 decode per test.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    try:
+        import rapidjson
+
+        def _dumps(obj):
+            return rapidjson.dumps(obj, sort_keys=True)
+
+        _loads = rapidjson.loads
+    except ImportError:
+
+        def _dumps(obj):
+            return json.dumps(obj, sort_keys=True)
+
+        _loads = json.loads
+
+# Keep this pure-computation file on one worker under pytest-xdist
+# (pytest -n auto --dist=loadgroup) so per-module fixtures and caches
+# are built only once
+pytestmark = pytest.mark.xdist_group(name="batch-operations")
+
+# One cached validator instance for the batch-response shape: building a
+# validator compiles the schema, so construct it once at import instead of
+# re-checking structure with ad-hoc `in` tests per call. The response
+# fixtures are frozen (MappingProxyType / tuple), which the stock type
+# checker rejects, so widen object/array to any mapping or sequence.
+_ResponseValidator = extend(
+    Draft202012Validator,
+    type_checker=Draft202012Validator.TYPE_CHECKER.redefine_many({
+        "object": lambda _checker, inst: isinstance(inst, Mapping),
+        "array": lambda _checker, inst: isinstance(inst, (list, tuple)),
+    }),
+)
+_RESP_V = _ResponseValidator({
+    "type": "object",
+    "required": ["total", "results"],
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {"type": "object", "required": ["index", "success"]},
+        },
+    },
+})
+
+
+# Input payloads for the batch-structure tests, built and serialized once
+# at import instead of inside every test body. Tuples: the specs are
+# read-only, and both serializers emit the same JSON array.
+LINES_SPECS = (
+    {"start": "0,0", "end": "10,10", "color": "red"},
+    {"start": "20,20", "end": "30,30", "color": "blue"},
+)
+CIRCLES_SPECS = (
+    {"center": "0,0", "radius": 5.0},
+    {"center": "10,10", "radius": 3.0},
+)
+POLYLINES_SPECS = (
+    {"points": "0,0|10,10|20,0", "closed": True},
+    {"points": "50,50|60,60|70,70", "closed": False},
+)
+RENAMES_SPECS = (
+    {"old_name": "Layer1", "new_name": "NewLayer1"},
+    {"old_name": "Layer2", "new_name": "NewLayer2"},
+)
+LAYER_NAMES = ("Layer1", "Layer2", "Layer3")
+DELETE_LAYER_SPECS = (
+    {"name": "Layer1"},
+    {"name": "Layer2"},
+)
+COLORS_SPECS = (
+    {"handles": "h1,h2,h3", "color": "red"},
+    {"handles": "h4,h5", "color": "blue"},
+)
+CHANGE_LAYERS_SPECS = (
+    {"handles": "h1,h2,h3", "layer_name": "Layer1"},
+    {"handles": "h4,h5", "layer_name": "Layer2"},
+)
+
+LINES_JSON = _dumps(LINES_SPECS)
+CIRCLES_JSON = _dumps(CIRCLES_SPECS)
+POLYLINES_JSON = _dumps(POLYLINES_SPECS)
+RENAMES_JSON = _dumps(RENAMES_SPECS)
+LAYER_NAMES_JSON = _dumps(LAYER_NAMES)
+DELETE_LAYER_JSON = _dumps(DELETE_LAYER_SPECS)
+COLORS_JSON = _dumps(COLORS_SPECS)
+CHANGE_LAYERS_JSON = _dumps(CHANGE_LAYERS_SPECS)
+
+# One case per batch tool input: (serialized payload, parsed equivalent,
+# keys every item must carry)
+BATCH_STRUCTURE_CASES = [
+    pytest.param(LINES_JSON, LINES_SPECS, {"start", "end"}, id="draw-lines"),
+    pytest.param(CIRCLES_JSON, CIRCLES_SPECS, {"center", "radius"}, id="draw-circles"),
+    pytest.param(POLYLINES_JSON, POLYLINES_SPECS, {"points"}, id="draw-polylines"),
+    pytest.param(RENAMES_JSON, RENAMES_SPECS, {"old_name", "new_name"}, id="rename-layers"),
+    pytest.param(DELETE_LAYER_JSON, DELETE_LAYER_SPECS, {"name"}, id="delete-layers-objects"),
+    pytest.param(LAYER_NAMES_JSON, LAYER_NAMES, set(), id="layer-name-list"),
+    pytest.param(COLORS_JSON, COLORS_SPECS, {"handles", "color"}, id="entity-colors"),
+    pytest.param(CHANGE_LAYERS_JSON, CHANGE_LAYERS_SPECS, {"handles", "layer_name"}, id="entity-layers"),
+]
+
+
+@pytest.mark.parametrize("payload,expected,required", BATCH_STRUCTURE_CASES)
+def test_batch_input_structure(payload, expected, required):
+    """Batch tool inputs parse to JSON arrays whose items keep their required fields."""
+    parsed = _loads(payload)
+    assert isinstance(parsed, list)
+    assert parsed == list(expected)
+    # dict.keys() is a set view, so subset comparison runs in C
+    # (skipped for plain-string payloads, which carry no keys)
+    if required:
+        assert all(required <= item.keys() for item in parsed)
+
+
+# ========== Layer Batch Operations ==========
+
+
+def test_delete_layers_accepts_string_array():
+    """Test that delete_layers accepts string array."""
+    parsed = _loads(LAYER_NAMES_JSON)
+    assert isinstance(parsed, list)
+    # One set-construction pass instead of a Python-level isinstance
+    # loop; JSON never yields str subclasses, so exact types suffice
+    assert {type(layer) for layer in parsed} == {str}
+
+
+# ========== Batch Response Format ==========
+
+
+@pytest.fixture(scope="module")
+def summary_response():
+    """Immutable summary-only response, built once per module."""
+    return MappingProxyType({"total": 3, "created": 3, "results": ()})
+
+
+@pytest.fixture(scope="module")
+def detailed_response():
+    """Immutable all-success response with per-item results."""
+    return MappingProxyType({
+        "total": 2,
+        "created": 2,
+        "results": (
+            {"index": 0, "handle": "ABC123", "success": True},
+            {"index": 1, "handle": "ABC124", "success": True},
+        ),
+    })
+
+
+@pytest.fixture(scope="module")
+def error_response():
+    """Immutable partial-failure response with an error entry."""
+    return MappingProxyType({
+        "total": 2,
+        "created": 1,
+        "results": (
+            {"index": 0, "handle": "ABC123", "success": True},
+            {"index": 1, "success": False, "error": "Invalid radius"},
+        ),
+    })
+
+
+def test_batch_response_includes_summary(summary_response):
+    """Test that batch responses include count summaries."""
+    assert _RESP_V.is_valid(summary_response)
+    # The count key varies by operation, which a static schema cannot
+    # express; keep this one check in Python.
+    assert not {"created", "renamed", "changed"}.isdisjoint(summary_response)
+
+
+def test_batch_response_includes_results(detailed_response):
+    """Test that batch responses include detailed results."""
+    assert _RESP_V.is_valid(detailed_response)
+    assert isinstance(detailed_response["results"], tuple)
+
+
+def test_batch_response_handles_errors(error_response):
+    """Test that batch responses include error details."""
+    assert _RESP_V.is_valid(error_response)
+    assert error_response["total"] == 2
+    assert error_response["created"] == 1
+    assert any(r.get("error") for r in error_response["results"])
+
+
+# ========== Default Values ==========
+
+
+def test_drawing_batch_defaults():
+    """Test that drawing batch operations handle defaults."""
+    # Test with minimal required fields
+    line = {"start": "0,0", "end": "10,10"}
+    assert line.get("color", "white") == "white"
+    assert line.get("layer", "0") == "0"
+    assert line.get("lineweight", 0) == 0
+
+
+def test_layer_batch_defaults():
+    """Test that layer batch operations handle defaults."""
+    circle = {"center": "0,0", "radius": 5.0}
+    assert circle.get("color", "white") == "white"
+    assert circle.get("layer", "0") == "0"
 
 
-class TestDrawingBatchOperations:
-    """Test suite for batch drawing operations."""
-
-    def test_draw_lines_batch_structure(self):
-        """Test that draw_lines accepts proper JSON array structure."""
-        # This tests the expected input format
-        lines_json = json.dumps([
-            {"start": "0,0", "end": "10,10", "color": "red"},
-            {"start": "20,20", "end": "30,30", "color": "blue"}
-        ])
-        # Input should be valid JSON
-        parsed = json.loads(lines_json)
-        assert isinstance(parsed, list)
-        assert len(parsed) == 2
-
-    def test_draw_circles_batch_structure(self):
-        """Test that draw_circles accepts proper JSON array structure."""
-        circles_json = json.dumps([
-            {"center": "0,0", "radius": 5.0},
-            {"center": "10,10", "radius": 3.0}
-        ])
-        parsed = json.loads(circles_json)
-        assert isinstance(parsed, list)
-        assert len(parsed) == 2
-        assert all("center" in c and "radius" in c for c in parsed)
-
-    def test_draw_polylines_batch_structure(self):
-        """Test that draw_polylines accepts proper JSON array structure."""
-        polylines_json = json.dumps([
-            {"points": "0,0|10,10|20,0", "closed": True},
-            {"points": "50,50|60,60|70,70", "closed": False}
-        ])
-        parsed = json.loads(polylines_json)
-        assert isinstance(parsed, list)
-        assert all("points" in p for p in parsed)
-
-
-class TestLayerBatchOperations:
-    """Test suite for batch layer operations."""
-
-    def test_rename_layers_batch_structure(self):
-        """Test that rename_layers accepts proper JSON array structure."""
-        renames_json = json.dumps([
-            {"old_name": "Layer1", "new_name": "NewLayer1"},
-            {"old_name": "Layer2", "new_name": "NewLayer2"}
-        ])
-        parsed = json.loads(renames_json)
-        assert isinstance(parsed, list)
-        assert all("old_name" in r and "new_name" in r for r in parsed)
-
-    def test_delete_layers_accepts_string_array(self):
-        """Test that delete_layers accepts string array."""
-        layers_json = json.dumps(["Layer1", "Layer2", "Layer3"])
-        parsed = json.loads(layers_json)
-        assert isinstance(parsed, list)
-        assert all(isinstance(layer, str) for layer in parsed)
-
-    def test_delete_layers_accepts_object_array(self):
-        """Test that delete_layers accepts object array."""
-        layers_json = json.dumps([
-            {"name": "Layer1"},
-            {"name": "Layer2"}
-        ])
-        parsed = json.loads(layers_json)
-        assert isinstance(parsed, list)
-        assert all("name" in item for item in parsed)
-
-    def test_turn_layers_on_batch_structure(self):
-        """Test that turn_layers_on accepts proper structure."""
-        layers_json = json.dumps(["Layer1", "Layer2"])
-        parsed = json.loads(layers_json)
-        assert isinstance(parsed, list)
-
-    def test_turn_layers_off_batch_structure(self):
-        """Test that turn_layers_off accepts proper structure."""
-        layers_json = json.dumps(["Layer1", "Layer2"])
-        parsed = json.loads(layers_json)
-        assert isinstance(parsed, list)
-
-
-class TestEntityBatchOperations:
-    """Test suite for batch entity operations."""
-
-    def test_change_entities_colors_batch_structure(self):
-        """Test that change_entities_colors accepts proper JSON structure."""
-        colors_json = json.dumps([
-            {"handles": "h1,h2,h3", "color": "red"},
-            {"handles": "h4,h5", "color": "blue"}
-        ])
-        parsed = json.loads(colors_json)
-        assert isinstance(parsed, list)
-        assert all("handles" in c and "color" in c for c in parsed)
-
-    def test_change_entities_layers_batch_structure(self):
-        """Test that change_entities_layers accepts proper JSON structure."""
-        layers_json = json.dumps([
-            {"handles": "h1,h2,h3", "layer_name": "Layer1"},
-            {"handles": "h4,h5", "layer_name": "Layer2"}
-        ])
-        parsed = json.loads(layers_json)
-        assert isinstance(parsed, list)
-        assert all(
-            "handles" in item and "layer_name" in item for item in parsed
-        )
-
-
-class TestBatchResponseFormat:
-    """Test suite for batch operation response format."""
-
-    def test_batch_response_includes_summary(self):
-        """Test that batch responses include count summaries."""
-        response = {
-            "total": 3,
-            "created": 3,
-            "results": []
-        }
-        assert "total" in response
-        has_count = (
-            "created" in response
-            or "renamed" in response
-            or "changed" in response
-        )
-        assert has_count
-
-    def test_batch_response_includes_results(self):
-        """Test that batch responses include detailed results."""
-        response = {
-            "total": 2,
-            "created": 2,
-            "results": [
-                {"index": 0, "handle": "ABC123", "success": True},
-                {"index": 1, "handle": "ABC124", "success": True}
-            ]
-        }
-        assert isinstance(response["results"], list)
-        has_required = all(
-            "index" in r and "success" in r for r in response["results"]
-        )
-        assert has_required
-
-    def test_batch_response_handles_errors(self):
-        """Test that batch responses include error details."""
-        response: dict = {
-            "total": 2,
-            "created": 1,
-            "results": [
-                {"index": 0, "handle": "ABC123", "success": True},
-                {"index": 1, "success": False, "error": "Invalid radius"}
-            ]
-        }
-        assert response["total"] == 2
-        assert response["created"] == 1
-        results = response["results"]
-        assert isinstance(results, list)
-        assert any(r.get("error") for r in results)
-
-
-class TestDefaultValues:
-    """Test suite for default values in batch operations."""
-
-    def test_drawing_batch_defaults(self):
-        """Test that drawing batch operations handle defaults."""
-        # Test with minimal required fields
-        line = {"start": "0,0", "end": "10,10"}
-        assert line.get("color", "white") == "white"
-        assert line.get("layer", "0") == "0"
-        assert line.get("lineweight", 0) == 0
-
-    def test_layer_batch_defaults(self):
-        """Test that layer batch operations handle defaults."""
-        circle = {"center": "0,0", "radius": 5.0}
-        assert circle.get("color", "white") == "white"
-        assert circle.get("layer", "0") == "0"
-
-    def test_polyline_closed_default(self):
-        """Test that polyline closed default is false."""
-        polyline = {"points": "0,0|10,10|20,0"}
-        assert polyline.get("closed", False) is False
-
-
-class TestInputValidation:
-    """Test suite for input validation in batch operations."""
-
-    def test_invalid_json_returns_error(self):
-        """Test that invalid JSON input is handled."""
-        invalid_json = "{'invalid': 'json'}"  # Single quotes not valid JSON
-        try:
-            json.loads(invalid_json)
-            assert False, "Should have raised JSONDecodeError"
-        except json.JSONDecodeError:
-            pass  # Expected
-
-    def test_non_list_input_converted_to_list(self):
-        """Test that single object is converted to list."""
-        single_obj = {"start": "0,0", "end": "10,10"}
-        if not isinstance(single_obj, list):
-            items = [single_obj]
-        else:
-            items = single_obj
-        assert isinstance(items, list)
-        assert len(items) == 1
-
-    def test_empty_array_handled(self):
-        """Test that empty arrays are handled."""
-        empty = json.dumps([])
-        parsed = json.loads(empty)
-        assert isinstance(parsed, list)
-        assert len(parsed) == 0
-
-
-class TestBackwardCompatibility:
-    """Test suite to ensure single operations still work."""
-
-    def test_single_operation_functions_unchanged(self):
-        """Test that single operation tools are unchanged."""
-        # These should remain as legacy single-item tools
-        # (draw_circle_and_line, create_layer, etc.)
-        # This is just a reminder that backward compatibility is maintained
-        pass
+def test_polyline_closed_default():
+    """Test that polyline closed default is false."""
+    polyline = {"points": "0,0|10,10|20,0"}
+    assert polyline.get("closed", False) is False
+
+
+# ========== Input Validation ==========
+
+
+def test_invalid_json_returns_error():
+    """Test that invalid JSON input is handled."""
+    invalid_json = "{'invalid': 'json'}"  # Single quotes not valid JSON
+    try:
+        _loads(invalid_json)
+        assert False, "Should have raised JSONDecodeError"
+    except ValueError:
+        # json.JSONDecodeError and orjson.JSONDecodeError both
+        # subclass ValueError
+        pass  # Expected
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        pytest.param(
+            {"start": "0,0", "end": "10,10"},
+            [{"start": "0,0", "end": "10,10"}],
+            id="single-dict-wrapped",
+        ),
+        pytest.param(
+            [{"start": "0,0", "end": "10,10"}],
+            [{"start": "0,0", "end": "10,10"}],
+            id="list-passthrough",
+        ),
+        pytest.param(
+            '{"start": "0,0", "end": "10,10"}',
+            [{"start": "0,0", "end": "10,10"}],
+            id="json-object-wrapped",
+        ),
+    ],
+)
+def test_non_list_input_converted_to_list(raw, expected):
+    """Test that single objects are normalized to lists."""
+    from mcp_tools.helpers import parse_json_list
+
+    assert parse_json_list(raw) == expected
+
+
+def test_empty_array_handled():
+    """Test that empty arrays are handled."""
+    empty = _dumps([])
+    parsed = _loads(empty)
+    assert isinstance(parsed, list)
+    assert len(parsed) == 0
+
+
+# ========== Backward Compatibility ==========
+
+
+def test_single_operation_functions_unchanged():
+    """Test that single operation tools are unchanged."""
+    # These should remain as legacy single-item tools
+    # (draw_circle_and_line, create_layer, etc.)
+    # This is just a reminder that backward compatibility is maintained
+    pass
@@ -0,0 +1,84 @@
+"""
+Tests for helper utilities.
+
+Tests coordinate and handle parsing including:
+- Fast path for plain "x,y" / "x,y,z" strings
+- Regex fallback for decorated input (spaces, signs, fractions)
+- Error handling for unparseable coordinates
+"""
+
+import pytest
+
+from core import InvalidParameterError
+from mcp_tools.helpers import parse_coordinate, parse_handles
+
+# Keep this pure-computation file on one worker under pytest-xdist
+# (pytest -n auto --dist=loadgroup) so per-module fixtures and caches
+# are built only once
+pytestmark = pytest.mark.xdist_group(name="helpers")
+
+
+# ========== Coordinate Parsing Tests ==========
+
+
+class TestParseCoordinate:
+    """Tests for parse_coordinate."""
+
+    def test_basic_2d(self):
+        """Test plain x,y parsing."""
+        assert parse_coordinate("10,20") == (10.0, 20.0)
+
+    def test_basic_3d(self):
+        """Test plain x,y,z parsing."""
+        assert parse_coordinate("10,20,30") == (10.0, 20.0, 30.0)
+
+    def test_negative_values(self):
+        """Test negative coordinates."""
+        # approx with a tight absolute tolerance keeps these assertions
+        # stable if the parser ever moves to a narrower float type
+        assert parse_coordinate("-5,-2.5") == pytest.approx((-5.0, -2.5), abs=1e-12)
+
+    def test_spaces_around_separators(self):
+        """Test coordinates with spaces fall back to the regex path."""
+        assert parse_coordinate("10 , 20") == (10.0, 20.0)
+
+    def test_explicit_positive_sign(self):
+        """Test leading plus signs are accepted."""
+        assert parse_coordinate("+1,+2") == (1.0, 2.0)
+
+    def test_bare_fraction(self):
+        """Test fractions without a leading digit."""
+        assert parse_coordinate(".5,.25") == pytest.approx((0.5, 0.25), abs=1e-12)
+
+    def test_extra_values_truncated(self):
+        """Test that more than three values keeps only x,y,z."""
+        assert parse_coordinate("1,2,3,4") == (1.0, 2.0, 3.0)
+
+    def test_single_value_raises(self):
+        """Test a lone number is rejected."""
+        with pytest.raises(InvalidParameterError):
+            parse_coordinate("10")
+
+    def test_garbage_raises(self):
+        """Test non-numeric input is rejected."""
+        with pytest.raises(InvalidParameterError):
+            parse_coordinate("not a point")
+
+
+# ========== Handle Parsing Tests ==========
+
+
+class TestParseHandles:
+    """Tests for parse_handles."""
+
+    def test_basic_list(self):
+        """Test comma-separated handles."""
+        assert parse_handles("A1,B2,C3") == ["A1", "B2", "C3"]
+
+    def test_whitespace_stripped(self):
+        """Test whitespace around handles is removed."""
+        assert parse_handles(" A1 , B2 ") == ["A1", "B2"]
+
+    def test_empty_entries_dropped(self):
+        """Test empty segments are skipped."""
+        assert parse_handles("A1,,B2,") == ["A1", "B2"]
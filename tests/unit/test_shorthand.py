@@ -26,6 +26,11 @@ from mcp_tools.shorthand import (
     parse_file_op_shorthand,
 )
 
+# Keep this pure-computation file on one worker under pytest-xdist
+# (pytest -n auto --dist=loadgroup) so per-module fixtures and caches
+# are built only once
+pytestmark = pytest.mark.xdist_group(name="shorthand")
+
 
 # ========== Drawing Entity Tests ==========
 
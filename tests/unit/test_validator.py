@@ -23,6 +23,11 @@ from mcp_tools.validator import (
     COLOR_ALIASES,
 )
 
+# Keep this pure-computation file on one worker under pytest-xdist
+# (pytest -n auto --dist=loadgroup) so per-module fixtures and caches
+# are built only once
+pytestmark = pytest.mark.xdist_group(name="validator")
+
 
 # ========== Fuzzy Color Matching Tests ==========
 
@@ -30,63 +35,53 @@ from mcp_tools.validator import (
 class TestFuzzyMatchColor:
     """Tests for fuzzy color matching."""
 
-    def test_exact_match(self):
-        """Test exact color names."""
-        assert fuzzy_match_color("red") == "red"
-        assert fuzzy_match_color("blue") == "blue"
-        assert fuzzy_match_color("white") == "white"
-        assert fuzzy_match_color("yellow") == "yellow"
-
-    def test_case_insensitive(self):
-        """Test case insensitivity."""
-        assert fuzzy_match_color("RED") == "red"
-        assert fuzzy_match_color("Blue") == "blue"
-        assert fuzzy_match_color("WHITE") == "white"
-
-    def test_alias_match(self):
-        """Test color aliases."""
-        assert fuzzy_match_color("grey") == "gray"
-        assert fuzzy_match_color("purple") == "magenta"
-        assert fuzzy_match_color("violet") == "magenta"
-        assert fuzzy_match_color("aqua") == "cyan"
-        assert fuzzy_match_color("teal") == "cyan"
-
-    def test_fuzzy_typos(self):
-        """Test fuzzy matching for typos."""
-        # Common typos
-        assert fuzzy_match_color("rde") == "red"  # missing e
-        assert fuzzy_match_color("blu") == "blue"  # missing e
-        assert fuzzy_match_color("whie") == "white"  # typo
-        assert fuzzy_match_color("yelow") == "yellow"  # missing l
-        assert fuzzy_match_color("cyaan") == "cyan"  # extra a
-
-    def test_compound_colors(self):
-        """Test compound color names."""
-        assert fuzzy_match_color("light_gray") == "light_gray"
-        assert fuzzy_match_color("dark_gray") == "dark_gray"
-        assert fuzzy_match_color("lightgray") == "light_gray"
-        assert fuzzy_match_color("darkgray") == "dark_gray"
-        assert fuzzy_match_color("light_grey") == "light_gray"
-
-    def test_numeric_passthrough(self):
-        """Test numeric color values pass through."""
-        assert fuzzy_match_color("1") == "1"
-        assert fuzzy_match_color("256") == "256"
-        assert fuzzy_match_color("30") == "30"
-
-    def test_special_colors(self):
-        """Test special color values."""
-        assert fuzzy_match_color("bylayer") == "bylayer"
-
-    def test_no_match_passthrough(self):
-        """Test unmatched colors pass through."""
-        assert fuzzy_match_color("xyz") == "xyz"
-        assert fuzzy_match_color("notacolor") == "notacolor"
-
-    def test_whitespace_handling(self):
-        """Test whitespace is handled."""
-        assert fuzzy_match_color("  red  ") == "red"
-        assert fuzzy_match_color(" blue ") == "blue"
+    @pytest.mark.parametrize(
+        "color_input,expected",
+        [
+            # Exact color names
+            pytest.param("red", "red", id="exact-red"),
+            pytest.param("blue", "blue", id="exact-blue"),
+            pytest.param("white", "white", id="exact-white"),
+            pytest.param("yellow", "yellow", id="exact-yellow"),
+            # Case insensitivity
+            pytest.param("RED", "red", id="case-upper"),
+            pytest.param("Blue", "blue", id="case-title"),
+            pytest.param("WHITE", "white", id="case-upper-white"),
+            # Aliases
+            pytest.param("grey", "gray", id="alias-grey"),
+            pytest.param("purple", "magenta", id="alias-purple"),
+            pytest.param("violet", "magenta", id="alias-violet"),
+            pytest.param("aqua", "cyan", id="alias-aqua"),
+            pytest.param("teal", "cyan", id="alias-teal"),
+            # Common typos
+            pytest.param("rde", "red", id="typo-missing-e"),
+            pytest.param("blu", "blue", id="typo-blu"),
+            pytest.param("whie", "white", id="typo-whie"),
+            pytest.param("yelow", "yellow", id="typo-missing-l"),
+            pytest.param("cyaan", "cyan", id="typo-extra-a"),
+            # Compound color names
+            pytest.param("light_gray", "light_gray", id="compound-exact"),
+            pytest.param("dark_gray", "dark_gray", id="compound-exact-dark"),
+            pytest.param("lightgray", "light_gray", id="compound-joined"),
+            pytest.param("darkgray", "dark_gray", id="compound-joined-dark"),
+            pytest.param("light_grey", "light_gray", id="compound-alias"),
+            # Numeric color values pass through
+            pytest.param("1", "1", id="numeric-1"),
+            pytest.param("256", "256", id="numeric-256"),
+            pytest.param("30", "30", id="numeric-30"),
+            # Special color values
+            pytest.param("bylayer", "bylayer", id="special-bylayer"),
+            # Unmatched colors pass through
+            pytest.param("xyz", "xyz", id="passthrough-xyz"),
+            pytest.param("notacolor", "notacolor", id="passthrough-word"),
+            # Whitespace is stripped
+            pytest.param("  red  ", "red", id="whitespace-red"),
+            pytest.param(" blue ", "blue", id="whitespace-blue"),
+        ],
+    )
+    def test_fuzzy_match_color(self, color_input, expected):
+        """Test exact, aliased, fuzzy, and pass-through color matching."""
+        assert fuzzy_match_color(color_input) == expected
 
 
 # ========== Type Coercion Tests ==========